@@ -1,6 +1,7 @@
-from easy_di.injection import inject, injected
+from easy_di.injection import Injectable, inject, injected
+from easy_di.lifetimes import Lifetime
 from easy_di.main import di_init
 from easy_di.resource_locator import DI
 
-__all__ = ["DI", "di_init", "injected", "inject"]
+__all__ = ["DI", "Injectable", "Lifetime", "di_init", "injected", "inject"]
 __version__ = "0.2.0"
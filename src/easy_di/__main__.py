@@ -0,0 +1,42 @@
+import argparse
+import sys
+from typing import List, Optional
+
+from easy_di.manifest import Manifest, ManifestScanner
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m easy_di")
+    commands = parser.add_subparsers(dest="command", required=True)
+    manifest_parser = commands.add_parser(
+        "manifest",
+        help="scan the sources of a package and write the manifest of the classes needing injection",
+    )
+    manifest_parser.add_argument("package", help="the package to scan")
+    manifest_parser.add_argument(
+        "-o", "--output", help="file to write the manifest to, stdout if missing"
+    )
+    manifest_parser.add_argument(
+        "--check",
+        metavar="MANIFEST",
+        help="don't write anything, fail if the given manifest differs from the sources",
+    )
+    arguments = parser.parse_args(argv)
+
+    manifest = ManifestScanner().scan_package(arguments.package)
+    if arguments.check:
+        differences = Manifest.load(arguments.check).diff(manifest)
+        for difference in differences:
+            print(difference, file=sys.stderr)
+        return 1 if differences else 0
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            output.write(manifest.to_json())
+            output.write("\n")
+    else:
+        print(manifest.to_json())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
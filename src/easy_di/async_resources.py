@@ -0,0 +1,119 @@
+from typing import Awaitable, Callable
+
+from easy_di import di_storage
+from easy_di.exceptions import AsyncResourceException, UndefinedResourceException
+from easy_di.injection import InjectionWrapper
+from easy_di.lifetimes import _NOT_BUILT, Lifetime, materialize
+
+
+class AsyncFactory:
+    """
+    Resource built by a coroutine function, registered with `DI.register_async`.
+
+    Only `DI.aget`, and the awaitable fields, can resolve it: the synchronous injection raises AsyncResourceException
+    until a singleton is built, then it replaces itself in the storage with the built object, like SingletonFactory, so
+    that the constructors and `DI.get` can use it.
+    """
+
+    def __init__(self, resource_name: str, factory: Callable[[], Awaitable]):
+        self.resource_name = resource_name
+        self.factory = factory
+
+    def __call__(self):
+        raise AsyncResourceException(
+            f"`{self.resource_name}` is built by a coroutine: use `await DI.aget`, or build it before with "
+            f"`await DI.awarmup`"
+        )
+
+    async def resolve(self):
+        return await self.factory()
+
+
+class AsyncSingletonFactory(AsyncFactory):
+    """
+    Awaits the factory once. The initialization is single-flight: the tasks resolving the resource while it's being
+    built wait for the same result, and if the build fails they get the error, then the following calls try again.
+
+    The build belongs to the event loop that started it.
+    """
+
+    def __init__(self, resource_name: str, factory: Callable[[], Awaitable]):
+        super().__init__(resource_name, factory)
+        self._instance = _NOT_BUILT
+        self._building = None
+
+    async def resolve(self):
+        # imported here: asyncio is slow to import and only needed by the applications using it
+        import asyncio
+
+        while self._instance is _NOT_BUILT:
+            building = self._building
+            if building is None:
+                return await self._build(asyncio.get_running_loop())
+            try:
+                return await asyncio.shield(building)
+            except asyncio.CancelledError:
+                if not building.cancelled():
+                    # this task has been cancelled, not the build
+                    raise
+        return self._instance
+
+    async def _build(self, loop):
+        building = self._building = loop.create_future()
+        try:
+            instance = await self.factory()
+        except BaseException as e:
+            self._building = None
+            if isinstance(e, Exception):
+                building.set_exception(e)
+                # retrieved by the waiting tasks, if any: no "exception was never retrieved" warning otherwise
+                building.exception()
+            else:
+                building.cancel()
+            raise
+        self._instance = instance
+        self._building = None
+        building.set_result(instance)
+        materialize(self.resource_name, self, instance)
+        return instance
+
+
+def wrap_async_factory(
+    resource_name: str, factory: Callable[[], Awaitable], lifetime: Lifetime
+) -> AsyncFactory:
+    if lifetime is Lifetime.SINGLETON:
+        return AsyncSingletonFactory(resource_name, factory)
+    if lifetime is Lifetime.TRANSIENT:
+        return AsyncFactory(resource_name, factory)
+    raise ValueError(f"Lifetime {lifetime.value} is not supported by async resources")
+
+
+async def aresolve(resource_name: str, default=None):
+    """Resolves the resource like `DI.get`, awaiting it if it's built by a coroutine"""
+    entry = di_storage.lookup(resource_name)
+    if entry is None:
+        if default is not None:
+            return default
+        raise UndefinedResourceException(resource_name)
+    value, is_factory = entry.binding
+    if isinstance(value, AsyncFactory):
+        return await value.resolve()
+    if is_factory:
+        return value()
+    return value
+
+
+class AsyncInjection:
+    """
+    Non-data descriptor installed on the class for each awaitable field: every access returns an awaitable resolving
+    the resource, `await self.session`. Nothing is stored in the instances.
+    """
+
+    def __init__(self, field_name: str, requirement: InjectionWrapper):
+        self.field_name = field_name
+        self.resource_name = requirement.name or field_name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return aresolve(self.resource_name)
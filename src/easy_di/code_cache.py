@@ -0,0 +1,121 @@
+import importlib.util
+import logging
+import marshal
+import os
+import sys
+import threading
+from types import CodeType
+from typing import Dict, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+
+def _library_version() -> str:
+    return sys.modules["easy_di"].__version__
+
+
+class _ModuleCodeCache:
+    def __init__(self, path: Optional[str], source_stamp: Tuple[int, int]):
+        self.path = path
+        self.source_stamp = source_stamp
+        self.entries: Dict[str, Tuple[str, CodeType]] = {}
+        self.dirty = False
+
+
+class CodeCache:
+    """
+    Persists the generated code, and its compiled code object, across process starts.
+
+    The code of each module is stored next to its bytecode (in `__pycache__`, or under `sys.pycache_prefix`) and, like
+    bytecode, it's discarded when the source file changes; the file name contains the library version and the
+    interpreter cache tag. Entries are added by the first run and written by `flush`.
+    """
+
+    def __init__(self):
+        self._modules: Dict[str, _ModuleCodeCache] = {}
+        self._lock = threading.Lock()
+
+    def get(self, module_name: str, key: str) -> Optional[Tuple[str, CodeType]]:
+        return self._module_cache(module_name).entries.get(key)
+
+    def put(self, module_name: str, key: str, source: str, code: CodeType):
+        module_cache = self._module_cache(module_name)
+        if module_cache.path is not None:
+            module_cache.entries[key] = (source, code)
+            module_cache.dirty = True
+
+    def flush(self):
+        """Writes the modules with new entries"""
+        if sys.dont_write_bytecode:
+            return
+        with self._lock:
+            module_caches = [cache for cache in self._modules.values() if cache.dirty]
+            for module_cache in module_caches:
+                module_cache.dirty = False
+        for module_cache in module_caches:
+            self._write(module_cache)
+
+    def _module_cache(self, module_name: str) -> _ModuleCodeCache:
+        try:
+            return self._modules[module_name]
+        except KeyError:
+            pass
+        module_cache = self._load(module_name)
+        with self._lock:
+            return self._modules.setdefault(module_name, module_cache)
+
+    @classmethod
+    def _load(cls, module_name: str) -> _ModuleCodeCache:
+        module = sys.modules.get(module_name)
+        source = getattr(module, "__file__", None)
+        try:
+            stat = os.stat(source)
+            path = importlib.util.cache_from_source(source)
+        except (TypeError, ValueError, NotImplementedError, OSError):
+            # no source file, or no bytecode cache for it
+            return _ModuleCodeCache(None, (0, 0))
+        path = f"{os.path.splitext(path)[0]}.easy_di-{_library_version()}.bin"
+        module_cache = _ModuleCodeCache(path, (stat.st_mtime_ns, stat.st_size))
+        try:
+            with open(path, "rb") as cache_file:
+                # our own file, next to the bytecode and as trusted: marshal is how the interpreter loads .pyc too
+                version, source_stamp, entries = marshal.load(cache_file)  # nosec
+        except FileNotFoundError:
+            return module_cache
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            _logger.debug("Discarding unreadable code cache %s: %s", path, e)
+            return module_cache
+        if version == FORMAT_VERSION and source_stamp == module_cache.source_stamp:
+            if cls._valid_entries(entries):
+                module_cache.entries = entries
+            else:
+                _logger.debug("Discarding malformed code cache %s", path)
+        return module_cache
+
+    @staticmethod
+    def _valid_entries(entries) -> bool:
+        return isinstance(entries, dict) and all(
+            isinstance(key, str)
+            and isinstance(entry, tuple)
+            and len(entry) == 2
+            and isinstance(entry[0], str)
+            and isinstance(entry[1], CodeType)
+            for key, entry in entries.items()
+        )
+
+    @classmethod
+    def _write(cls, module_cache: _ModuleCodeCache):
+        data = marshal.dumps(
+            (FORMAT_VERSION, module_cache.source_stamp, dict(module_cache.entries))
+        )
+        temporary_path = f"{module_cache.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(module_cache.path), exist_ok=True)
+            with open(temporary_path, "wb") as cache_file:
+                cache_file.write(data)
+            os.replace(temporary_path, module_cache.path)
+        except OSError as e:
+            # Like bytecode, the cache is an optimisation: read only file systems are fine
+            _logger.debug("Can't write code cache %s: %s", module_cache.path, e)
@@ -1,13 +1,204 @@
-import sys
+import os
+import threading
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+class Entry:
+    """A registered resource. There is a single entry per resource name, created when the resource is registered or
+    first needed, and updated in place: generated constructors bind directly to it.
+
+    Registrations publish the value and its kind together, as the immutable `binding` tuple, so that a single
+    attribute read never sees a value with the flag of another registration. The constructors specialised on the kind
+    of the resource read the `instance` or `factory` slot instead: each one is only ever written with values of its
+    own kind, so a constructor not rebuilt yet after a change of kind reads the previous value of its kind, never a
+    value of the wrong one. Reads take no lock."""
+
+    __slots__ = ("name", "binding", "instance", "factory", "version")
+
+    def __init__(self, name: str):
+        self.name = name
+        # incremented by every registration, 0 means not registered yet
+        self.version = 0
+
+    def __getattr__(self, item):
+        # Only called when the slots are not set: the resource is not registered
+        raise AttributeError(self.name)
+
+    @property
+    def value(self):
+        return self.binding[0]
+
+    @property
+    def is_factory(self) -> bool:
+        return self.binding[1]
+
+    def __repr__(self):
+        return f"Entry({self.name!r}, version={self.version})"
+
+
+class Scope:
+    """
+    The resources registered inside a `DI.scope()` block: they override, for the code running in the block, the ones
+    of the enclosing scope or the global ones.
+
+    The block is bound to the current context (`contextvars`): the asyncio tasks created in the block see its
+    resources, the other threads and tasks don't. When the block ends its resources are dropped.
+    """
+
+    __slots__ = ("parent", "overrides", "_token")
+
+    def __init__(self):
+        self.parent: Optional[Scope] = None
+        self.overrides: Dict[str, Tuple[object, bool]] = {}
+        self._token = None
+
+    def __enter__(self) -> "Scope":
+        self.parent = _current_scope.get()
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _current_scope.reset(self._token)
+        self._token = None
+        self.overrides.clear()
+
+    def find(self, key) -> Optional[Tuple[object, bool]]:
+        """The value and factory flag registered for the resource in this scope or in the enclosing ones"""
+        scope = self
+        while scope is not None:
+            override = scope.overrides.get(key)
+            if override is not None:
+                return override
+            scope = scope.parent
+        return None
+
+
+_current_scope: ContextVar = ContextVar("easy_di_scope", default=None)
+
+_global_binding = Entry.binding
+
+
+def _scoped_binding(entry_: "ScopedEntry") -> Tuple[object, bool]:
+    scope = _current_scope.get()
+    if scope is not None:
+        override = scope.find(entry_.name)
+        if override is not None:
+            return override
+    return _global_binding.__get__(entry_)
+
+
+class ScopedEntry(Entry):
+    """An entry overridden in some scope: reading its binding looks up the current scope first. Entries become scoped
+    when a scope first registers their resource, the others keep the plain slot read. The constructors are not
+    specialised on the kind of scoped resources, so they read the binding."""
+
+    __slots__ = ()
+
+    binding = property(_scoped_binding, _global_binding.__set__)
+
+
+entries: Dict[str, Entry] = {}
+# serialises the global registrations, held by the callers of `store`
+registration_lock = threading.RLock()
+# the resources whose entry is scoped, once the constructors reading them have been rebuilt
+_scoped_names: Set[str] = set()
+
+
+def _reinit_locks():
+    # A thread of the parent process may have held it while forking
+    global registration_lock  # pylint: disable=global-statement
+    registration_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinit_locks)
+
+
+def entry(key) -> Entry:
+    """Returns the entry of the resource, creating an empty one if the resource is not registered"""
+    try:
+        return entries[key]
+    except KeyError:
+        return entries.setdefault(key, Entry(key))
+
+
+def current_scope() -> Optional[Scope]:
+    return _current_scope.get()
+
+
+def lookup(key) -> Optional[Entry]:
+    """Returns the entry of the resource, None if it's not registered"""
+    entry_ = entries.get(key)
+    if entry_ is None:
+        return None
+    if not entry_.version:
+        scope = _current_scope.get()
+        if scope is None or scope.find(key) is None:
+            return None
+    return entry_
+
+
+def global_binding(key) -> Optional[Tuple[object, bool]]:
+    """The value and factory flag registered globally for the resource, ignoring the current scope, None if it's not
+    registered"""
+    entry_ = entries.get(key)
+    if entry_ is None or not entry_.version:
+        return None
+    return _global_binding.__get__(entry_)
 
 
 def store(key, value, is_factory):
-    module = sys.modules[__name__]
-    attribute, factory_attribute = module.keys(key)
+    """Registers the resource globally. The callers serialise the registrations: the reads need no lock"""
+    entry_ = entry(key)
+    is_factory = bool(is_factory)
+    if is_factory:
+        entry_.factory = value
+    else:
+        entry_.instance = value
+    entry_.binding = (value, is_factory)
+    entry_.version += 1
+
+
+def store_scoped(scope: Scope, key, value, is_factory, rebuild: Callable[[str], None]):
+    """Registers the resource in the scope. The first time a resource is registered in a scope its entry becomes
+    scoped, and `rebuild` is called with its name to rebuild the constructors specialised on its kind: the concurrent
+    scoped registrations of the resource wait for it, they can't build objects with the previous constructors"""
+    if key not in _scoped_names:
+        with registration_lock:
+            if key not in _scoped_names:
+                entry(key).__class__ = ScopedEntry
+                rebuild(key)
+                _scoped_names.add(key)
+    scope.overrides[key] = (value, bool(is_factory))
+
 
-    setattr(module, attribute, value)
-    setattr(module, factory_attribute, is_factory)
+def replace(key, old_value, new_value) -> bool:
+    """Replaces, with a non-factory value, the factory registered for the resource where it was found: in the
+    current scope chain or globally. Returns True if the global value changed"""
+    scope = _current_scope.get()
+    while scope is not None:
+        override = scope.overrides.get(key)
+        if override is not None:
+            if override[0] is old_value:
+                scope.overrides[key] = (new_value, False)
+            return False
+        scope = scope.parent
+    with registration_lock:
+        entry_ = entries.get(key)
+        if entry_ is None or not entry_.version:
+            return False
+        if _global_binding.__get__(entry_)[0] is not old_value:
+            # registered again in the meanwhile
+            return False
+        store(key, new_value, False)
+        return True
 
 
-def keys(key):
-    return f"__{key}__", f"__{key}_is_factory__"
+def is_factory(key):
+    """Whether the resource is registered as a factory, None if it's not registered at all or if it's overridden in
+    some scope: then it depends on the context"""
+    entry_ = lookup(key)
+    if entry_ is None or type(entry_) is ScopedEntry:
+        return None
+    return entry_.is_factory
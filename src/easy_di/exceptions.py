@@ -8,3 +8,19 @@ class DuplicateResourceException(RuntimeError):
 
 class MissingConstructorException(RuntimeError):
     pass
+
+
+class MissingSlotException(RuntimeError):
+    pass
+
+
+class FrozenRegistryException(RuntimeError):
+    pass
+
+
+class AsyncResourceException(RuntimeError):
+    pass
+
+
+class DependencyCycleException(RuntimeError):
+    pass
@@ -1,13 +1,27 @@
-import builtins
-import inspect
 import logging
-import re
 import sys
-from types import ModuleType
-from typing import Callable, Dict, Optional, Type, TypeVar
+import threading
+import weakref
+from time import perf_counter_ns
+from types import CodeType, MemberDescriptorType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from easy_di import di_storage
-from easy_di.exceptions import UndefinedResourceException
+from easy_di import di_storage, metrics
+from easy_di.exceptions import MissingSlotException, UndefinedResourceException
+
+if TYPE_CHECKING:
+    from easy_di.code_cache import CodeCache
+    from easy_di.profiling import StartupProfile
 
 _logger = logging.getLogger(__name__)
 
@@ -16,7 +30,14 @@ INJECTION_MARKER = "__id_injected__"
 TYPE = TypeVar("TYPE")
 
 
-def injected(type_: TYPE, name: Optional[str] = None, force_no_factory=False) -> TYPE:
+def injected(
+    type_: TYPE,
+    name: Optional[str] = None,
+    force_no_factory=False,
+    lazy: Optional[bool] = None,
+    shared: bool = False,
+    awaitable: bool = False,
+) -> TYPE:
     """
     Specify that a class attribute must be injected at runtime in every instance of the class.
 
@@ -24,8 +45,14 @@ def injected(type_: TYPE, name: Optional[str] = None, force_no_factory=False) ->
     :arg name the name of the looked up resource, if different from the field name
     :arg force_no_factory if you're sure the injected resource won't be a factory you can set this flag to true, and
             you'll gain a consistent performances improvement
+    :arg lazy if True the resource is resolved on first access to the attribute instead of in the constructor; when
+            None the class `__di_lazy__` attribute or `DiClassInjector.lazy_by_default` decide
+    :arg shared if True the field is not stored in the instances: a class attribute reads the registered resource on
+            every access. Meant for resources that are the same object for everybody, like loggers or configuration
+    :arg awaitable if True every access to the field returns an awaitable resolving the resource, `await self.field`:
+            meant for the resources registered with `DI.register_async`
     """
-    return InjectionWrapper(type_, name, force_no_factory)
+    return InjectionWrapper(type_, name, force_no_factory, lazy, shared, awaitable)
 
 
 def inject(module_name: str):
@@ -33,43 +60,388 @@ def inject(module_name: str):
 
 
 class InjectionWrapper:
-    def __init__(self, class_, name: Optional[str], force_no_factory=False):
+    def __init__(
+        self,
+        class_,
+        name: Optional[str],
+        force_no_factory=False,
+        lazy: Optional[bool] = None,
+        shared: bool = False,
+        awaitable: bool = False,
+    ):
         self.class_ = class_
         self.name = name
         self.force_no_factory = force_no_factory
+        self.lazy = lazy
+        self.shared = shared
+        self.awaitable = awaitable
+
+
+class LazyInjection:
+    """
+    Non-data descriptor installed on the class for each lazy field: the first access resolves the resource and stores
+    it in the instance, so that following accesses don't go through the descriptor anymore.
+    """
+
+    def __init__(
+        self, field_name: str, requirement: InjectionWrapper, getter: Callable
+    ):
+        self.field_name = field_name
+        self.requirement = requirement
+        self.getter = getter
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.getter(instance)
+
+
+class LazySlotInjection(LazyInjection):
+    """
+    Data descriptor replacing the slot of a lazy field: the resource is resolved when the slot is still empty, and
+    stored into the slot.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        requirement: InjectionWrapper,
+        getter: Callable,
+        slot: MemberDescriptorType,
+    ):
+        super().__init__(field_name, requirement, getter)
+        self.slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            return self.getter(instance)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+
+class SharedInjection:
+    """
+    Non-data descriptor installed on the class for each shared field: it returns the registered resource, so the
+    constructor does nothing for the field and the instances don't store it.
+
+    A factory resource is called on the first access and the object it built is returned until another factory is
+    registered, so that every instance sees the same object; the thread lifetime factories are called on every access,
+    returning the object of the current thread.
+    """
+
+    def __init__(self, field_name: str, requirement: InjectionWrapper):
+        self.field_name = field_name
+        self.requirement = requirement
+        self.entry = di_storage.entry(requirement.name or field_name)
+        # the factory last called and the object it built
+        self._built = (None, None)
+        self._lock = threading.RLock()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value, is_factory = self.entry.binding
+        except AttributeError as e:
+            raise UndefinedResourceException(
+                f"`{e.args[0]}` Needed by class {instance.__class__.__name__}"
+            ) from e
+        if is_factory and not self.requirement.force_no_factory:
+            return self._build(value)
+        return value
+
+    def _build(self, factory: Callable):
+        built_by, built = self._built
+        if built_by is factory:
+            return built
+        if getattr(factory, "__di_per_thread__", False):
+            return factory()
+        with self._lock:
+            built_by, built = self._built
+            if built_by is not factory:
+                built = factory()
+                self._built = (factory, built)
+            return built
+
+
+def slot_descriptor(class_: Type, field_name: str) -> Optional[MemberDescriptorType]:
+    """Returns the descriptor of the slot storing the field, None if the field is not declared in `__slots__`"""
+    for klass in class_.__mro__:
+        if field_name in klass.__dict__:
+            attribute = klass.__dict__[field_name]
+            if isinstance(attribute, LazySlotInjection):
+                return attribute.slot
+            if isinstance(attribute, MemberDescriptorType):
+                return attribute
+            return None
+    return None
+
+
+class ModuleScope:
+    """The modules inspected by the import hook and by the initial sweep: the ones in `packages` (all of them when it's
+    None) and not in `exclude`. A package includes its subpackages and modules."""
+
+    def __init__(
+        self,
+        packages: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ):
+        self.packages = None if packages is None else frozenset(packages)
+        self.exclude = frozenset(exclude or ())
+        self._packages_prefixes = tuple(f"{name}." for name in self.packages or ())
+        self._exclude_prefixes = tuple(f"{name}." for name in self.exclude)
+
+    def __contains__(self, module_name: str) -> bool:
+        if module_name in self.exclude or module_name.startswith(
+            self._exclude_prefixes
+        ):
+            return False
+        return (
+            self.packages is None
+            or module_name in self.packages
+            or module_name.startswith(self._packages_prefixes)
+        )
+
+    def candidates(self, module: ModuleType) -> Iterable:
+        """The objects of an in-scope module that may be classes to inject"""
+        return list(module.__dict__.values())
 
 
 class DiModuleInjector:
+    scope = ModuleScope()
+    # records where the injection spends its time, see `profiling.enable`
+    profile: "Optional[StartupProfile]" = None
+
     def inject(self, module: ModuleType):
         if not isinstance(module, ModuleType):
             return
+        self._inject_classes(module, module.__dict__.values())
+
+    def inject_scoped(self, module: ModuleType):
+        """Injects the module only if it's in the current scope: used by the import hook and by `di_init`"""
+        if not isinstance(module, ModuleType) or module.__name__ not in self.scope:
+            return
+        profile = self.profile
+        if profile is None:
+            self._inject_classes(module, self.scope.candidates(module))
+            return
+        start = perf_counter_ns()
+        candidates = list(self.scope.candidates(module))
+        wrapped = self._inject_classes(module, candidates)
+        inspected = sum(
+            1
+            for candidate in candidates
+            if isinstance(candidate, type) and candidate.__module__ == module.__name__
+        )
+        profile.module_scanned(
+            module.__name__, perf_counter_ns() - start, inspected, wrapped
+        )
+
+    def _inject_classes(self, module: ModuleType, candidates: Iterable) -> int:
+        """Returns the number of classes needing injection"""
         injector = DiClassInjector()
-        for module_object in module.__dict__.values():
+        injected = 0
+        for module_object in candidates:
             if self._is_injectable_class(module_object, module.__name__):
-                injector.inject(module_object)
+                injected += injector.inject(module_object)
+        return injected
 
     @classmethod
     def _is_injectable_class(cls, object_: Type, module_name: str):
         return bool(
-            inspect.isclass(object_)
+            isinstance(object_, type)
             and object_.__module__ == module_name
             and getattr(object_, "__annotations__", None)
+            # already injected when they were created
+            and not issubclass(object_, Injectable)
         )
 
 
-_BUILTIN_TYPES = {
-    name: type_ for name, type_ in builtins.__dict__.items() if isinstance(type_, type)
-}
+def _requirements_key(requirements: Dict[str, InjectionWrapper]) -> tuple:
+    return tuple(
+        (field_name, requirement.name, bool(requirement.force_no_factory))
+        for field_name, requirement in requirements.items()
+    )
+
+
+def _resource_names(requirements: Dict[str, InjectionWrapper]):
+    return {
+        requirement.name or field_name
+        for field_name, requirement in requirements.items()
+    }
+
+
+class ConsumersIndex:
+    """Reverse index from resource names to the injected classes, and their fields, that need them"""
+
+    def __init__(self):
+        self._index: Dict[str, weakref.WeakKeyDictionary] = {}
+
+    def add(self, class_: Type, requirements: Dict[str, InjectionWrapper]):
+        for field_name, requirement in requirements.items():
+            fields = self._index.setdefault(
+                requirement.name or field_name, weakref.WeakKeyDictionary()
+            ).setdefault(class_, [])
+            if field_name not in fields:
+                fields.append(field_name)
+
+    def consumers(self, resource_name: str) -> Dict[Type, List[str]]:
+        # the index is changed under the lock, by the injection of new classes
+        with di_storage.registration_lock:
+            return {
+                class_: list(fields)
+                for class_, fields in self._index.get(resource_name, {}).items()
+            }
+
+    def resource_changed(self, resource_name: str):
+        """Rebuilds the constructors specialised on a different kind (factory or not) of the resource. The generic
+        constructors, reading a resource whose kind was unknown, are still correct: they are specialised on their
+        first call instead, once for all the resources registered in the meanwhile"""
+        is_factory = di_storage.is_factory(resource_name)
+        wrapper = ConstructorWrapper()
+        for class_ in list(self._index.get(resource_name, ())):
+            constructor = class_.__dict__.get("__init__")
+            kinds = getattr(constructor, "__di_kinds__", None)
+            if (
+                kinds is None
+                or getattr(constructor, "__di_frozen__", False)
+                or getattr(constructor, "__di_pending__", False)
+            ):
+                # lazy fields only, frozen constructor, or rebuilt on its first call
+                continue
+            if resource_name in kinds and kinds[resource_name] != is_factory:
+                if kinds[resource_name] is None:
+                    class_.__init__ = wrapper.rewrap_on_first_call(class_)
+                else:
+                    class_.__init__ = wrapper.rewrap_constructor(class_)
+            elif bundle := getattr(constructor, "__di_bundle__", None):
+                value = di_storage.entry(resource_name).value
+                for field_name in self._index[resource_name].get(class_, ()):
+                    if field_name in bundle:
+                        bundle[field_name] = value
+
+
+class StringAnnotationResolver:
+    """
+    Finds the `injected` calls in the string annotations of the modules using postponed evaluation (PEP 563).
+
+    Only the annotations containing `injected`, or one of its aliases, are parsed, and the result is memoized per
+    module: classes sharing their dependencies repeat the same annotations. The call may be wrapped, like in
+    `Optional[injected(Client)]`, and the arguments are evaluated in the module namespace, so dotted and generic types
+    (`injected(api.Client)`, `injected(List[Client])`) and keyword arguments work like in ordinary annotations. A type
+    that can't be evaluated, like a class imported only when `TYPE_CHECKING`, is kept as a string: it's only
+    informative.
+    """
+
+    TYPE_ARGUMENT = "type_"
+
+    def __init__(self):
+        self._memo: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def resolve(
+        self, module: ModuleType, annotation: str
+    ) -> Optional[InjectionWrapper]:
+        try:
+            names, module_memo = self._memo[module]
+        except KeyError:
+            names, module_memo = self._memo.setdefault(
+                module, (self._injected_names(module), {})
+            )
+        if not any(name in annotation for name in names):
+            return None
+        try:
+            return module_memo[annotation]
+        except KeyError:
+            pass
+        reference = module_memo[annotation] = self._parse(module, annotation)
+        return reference
+
+    @classmethod
+    def _injected_names(cls, module: ModuleType) -> Tuple[str, ...]:
+        """`injected` and its aliases in the module, like `from easy_di import injected as dependency`"""
+        aliases = [
+            name
+            for name, value in module.__dict__.items()
+            if value is injected and name != "injected"
+        ]
+        return ("injected", *aliases)
+
+    @classmethod
+    def _parse(cls, module: ModuleType, annotation: str) -> Optional[InjectionWrapper]:
+        # imported here: ast is slow to import and only needed by the modules with postponed annotations
+        import ast
+
+        try:
+            expression = ast.parse(annotation, mode="eval")
+        except SyntaxError:
+            return None
+        for node in ast.walk(expression.body):
+            if isinstance(node, ast.Call) and cls._is_injected(module, node.func):
+                return cls._build(module, annotation, node)
+        return None
+
+    @classmethod
+    def _is_injected(cls, module: ModuleType, function) -> bool:
+        import ast
+
+        if isinstance(function, ast.Name):
+            return (
+                function.id == "injected"
+                or module.__dict__.get(function.id) is injected
+            )
+        return isinstance(function, ast.Attribute) and function.attr == "injected"
+
+    @classmethod
+    def _build(cls, module: ModuleType, annotation: str, call) -> InjectionWrapper:
+        args = [
+            cls._evaluate(module, annotation, argument, is_type=index == 0)
+            for index, argument in enumerate(call.args)
+        ]
+        kwargs = {
+            keyword.arg: cls._evaluate(
+                module, annotation, keyword.value, keyword.arg == cls.TYPE_ARGUMENT
+            )
+            for keyword in call.keywords
+        }
+        return injected(*args, **kwargs)
+
+    @classmethod
+    def _evaluate(cls, module: ModuleType, annotation: str, node, is_type: bool):
+        import ast
+
+        code = compile(ast.Expression(node), module.__name__, "eval")
+        try:
+            # pylint: disable=eval-used
+            return eval(code, module.__dict__)  # nosec
+            # Like typing.get_type_hints, we evaluate the annotations written in the module
+        except Exception:  # pylint: disable=broad-except
+            if not is_type:
+                raise
+            return ast.get_source_segment(annotation, node)
 
 
 class DiClassInjector:
-    INJECT_RE = re.compile(
-        r"(Optional\[)?injected\((?P<class_>[A-Za-z_][A-Z-a-z_0-9]+)\s*(,\s*['|\"](?P<name>[^'\"]+)['\"])?\s*\)(])?"
-    )
+    lazy_by_default = False
+    flatten_by_default = False
+    bulk_by_default = False
+    injected_classes = weakref.WeakSet()
+    consumers_index = ConsumersIndex()
+
+    annotation_resolver = StringAnnotationResolver()
 
-    def inject(self, class_: Type):
+    def inject(self, class_: Type) -> bool:
+        """Returns True if the class needs injection"""
         requirements: Dict[str, InjectionWrapper] = {}
         module = sys.modules[class_.__module__]
+        profile = DiModuleInjector.profile
         try:
             annotations_ = class_.__annotations__.items()
         except AttributeError:
@@ -79,9 +451,12 @@ class DiClassInjector:
             annotations_ = {}
         for field_name, resource_reference in annotations_:
             if isinstance(resource_reference, str):
+                start = 0 if profile is None else perf_counter_ns()
                 resource_reference = self._translate_string_into_reference(
                     module, resource_reference
                 )
+                if profile is not None:
+                    profile.annotations_resolved(class_, perf_counter_ns() - start)
 
             if isinstance(resource_reference, InjectionWrapper):
                 _logger.debug(
@@ -94,31 +469,107 @@ class DiClassInjector:
                 requirements[field_name] = resource_reference
 
         if not requirements:
+            return False
+
+        # like a registration: the kinds and values the constructor is built from must not change until it's
+        # installed, else `resource_changed` would miss it
+        with di_storage.registration_lock:
+            self._install_requirements(class_, requirements)
+        return True
+
+    def _install_requirements(
+        self, class_: Type, requirements: Dict[str, InjectionWrapper]
+    ):
+        self.consumers_index.add(class_, requirements)
+        for field_name, requirement in list(requirements.items()):
+            if requirement.shared:
+                self._install_shared_field(class_, field_name, requirement)
+                del requirements[field_name]
+            elif requirement.awaitable:
+                self._install_awaitable_field(class_, field_name, requirement)
+                del requirements[field_name]
+        self._check_storage(class_, requirements)
+        eager_requirements = {}
+        for field_name, requirement in requirements.items():
+            if self._is_lazy(class_, requirement):
+                self._install_lazy_field(class_, field_name, requirement)
+            else:
+                eager_requirements[field_name] = requirement
+
+        if eager_requirements:
+            self._wrap_constructor(class_, eager_requirements)
+
+    @classmethod
+    def _check_storage(cls, class_: Type, requirements: Dict[str, InjectionWrapper]):
+        if class_.__dictoffset__:
+            # instances have a __dict__
+            return
+        for field_name in requirements:
+            if slot_descriptor(class_, field_name) is None:
+                raise MissingSlotException(
+                    f"Class {class_.__name__} uses __slots__ but has no slot for the injected field {field_name}"
+                )
+
+    @classmethod
+    def _is_lazy(cls, class_: Type, requirement: InjectionWrapper) -> bool:
+        if requirement.lazy is not None:
+            return requirement.lazy
+        return getattr(class_, "__di_lazy__", cls.lazy_by_default)
+
+    @classmethod
+    def _install_lazy_field(
+        cls, class_: Type, field_name: str, requirement: InjectionWrapper
+    ):
+        if isinstance(class_.__dict__.get(field_name), LazyInjection):
+            # Descriptor already installed
             return
+        getter = ConstructorWrapper().wrap_lazy_getter(class_, field_name, requirement)
+        slot = slot_descriptor(class_, field_name)
+        if slot is None:
+            descriptor = LazyInjection(field_name, requirement, getter)
+        else:
+            descriptor = LazySlotInjection(field_name, requirement, getter, slot)
+        setattr(class_, field_name, descriptor)
 
-        self._wrap_constructor(class_, requirements)
+    @classmethod
+    def _install_shared_field(
+        cls, class_: Type, field_name: str, requirement: InjectionWrapper
+    ):
+        if not isinstance(class_.__dict__.get(field_name), SharedInjection):
+            setattr(class_, field_name, SharedInjection(field_name, requirement))
+
+    @classmethod
+    def _install_awaitable_field(
+        cls, class_: Type, field_name: str, requirement: InjectionWrapper
+    ):
+        # imported here: async_resources imports this module, a top level import would be circular
+        from easy_di.async_resources import AsyncInjection
+
+        if not isinstance(class_.__dict__.get(field_name), AsyncInjection):
+            setattr(class_, field_name, AsyncInjection(field_name, requirement))
 
     def _translate_string_into_reference(self, module, resource_reference):
-        if match := self.INJECT_RE.match(resource_reference):
-            other_class_name = match.group("class_")
-            if other_class_name in _BUILTIN_TYPES:
-                other_class = _BUILTIN_TYPES[other_class_name]
-            else:
-                other_class = module.__getattribute__(other_class_name)
-            name = match.group("name") or None
-            resource_reference = injected(other_class, name)
-        return resource_reference
+        return (
+            self.annotation_resolver.resolve(module, resource_reference)
+            or resource_reference
+        )
 
     def _wrap_constructor(
         self, class_: Type, requirements: Dict[str, InjectionWrapper]
     ):
         # assure there is a constructor
         constructor = self._get_or_create_constructor(class_)
+        if constructor is DiClassInjector.call_parent and getattr(
+            class_, "__di_flatten__", self.flatten_by_default
+        ):
+            requirements, constructor = self._flatten(class_, requirements)
+            self.consumers_index.add(class_, requirements)
         injected_constructor = ConstructorWrapper().wrap_constructor(
             class_, constructor, requirements
         )
         class_.__init__ = injected_constructor
         setattr(class_, INJECTION_MARKER, class_)
+        self.injected_classes.add(class_)
 
     @classmethod
     def _get_or_create_constructor(cls, class_: Type):
@@ -139,12 +590,61 @@ class DiClassInjector:
 
         return constructor
 
+    @classmethod
+    def _flatten(cls, class_: Type, requirements: Dict[str, InjectionWrapper]):
+        """
+        Merges into the requirements of a class without its own constructor the requirements of the parents whose
+        constructors only inject resources, up to the first parent with a user defined constructor, which is returned
+        to be called directly. The parents must have already been injected.
+
+        The user defined constructors, and the injected constructors of the classes above them, are still reached
+        through their `super().__init__()` calls. Multiple inheritance is not flattened.
+        """
+        flattened = dict(requirements)
+        for parent in class_.__mro__:
+            if len(parent.__bases__) > 1:
+                return requirements, DiClassInjector.call_parent
+            if parent is class_ or "__init__" not in parent.__dict__:
+                continue
+            parent_constructor = parent.__dict__["__init__"]
+            parent_requirements = getattr(
+                parent_constructor, "__di_requirements__", None
+            )
+            if parent_requirements is None:
+                return flattened, parent_constructor
+            for field_name, requirement in parent_requirements.items():
+                flattened.setdefault(field_name, requirement)
+            parent_constructor = parent_constructor.__di_wrapped__
+            if parent_constructor is not DiClassInjector.call_parent:
+                return flattened, parent_constructor
+        return flattened, object.__init__
+
     @staticmethod
     def call_parent():
         pass
 
 
+class Injectable:
+    """
+    Base class for the classes needing injection: they are injected when they are created, by `__init_subclass__`, so
+    they don't need the import hook.
+
+    The string annotations (PEP 563) are resolved while the module is still being executed: the types defined after
+    the class are kept as strings, the names of the resources must be literals or already defined.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        DiClassInjector().inject(cls)
+
+
 class ConstructorWrapper:
+    code_cache: "Optional[CodeCache]" = None
+    # the constructors count the resolutions and time the factories, see `DI.enable_stats`
+    instrumented = False
+
     def wrap_constructor(
         self,
         class_: Type,
@@ -155,47 +655,378 @@ class ConstructorWrapper:
             # Process each class just once
             return constructor
 
-        code = self._assemble_code(requirements, constructor)
-        constructor_ = self._compile_wrapper(code, constructor, class_)
+        return self._build_constructor(class_, constructor, requirements)
+
+    def rewrap_constructor(self, class_: Type) -> Callable:
+        """Rebuilds the constructor of an already injected class, specialising it on the current kind of the needed
+        resources"""
+        constructor_ = class_.__dict__["__init__"]
+        return self._build_constructor(
+            class_, constructor_.__di_wrapped__, constructor_.__di_requirements__
+        )
+
+    def rewrap_on_first_call(self, class_: Type) -> Callable:
+        """Returns a constructor replacing itself with the rebuilt one, see `rewrap_constructor`, when first called:
+        the classes never constructed are not compiled again"""
+        constructor_ = class_.__dict__["__init__"]
+
+        def pending_constructor(self_, *params, **kwargs):
+            with di_storage.registration_lock:
+                # unless rebuilt, or frozen, by another thread in the meanwhile
+                if class_.__dict__.get("__init__") is pending_constructor:
+                    class_.__init__ = self.rewrap_constructor(class_)
+            class_.__dict__["__init__"](self_, *params, **kwargs)
+
+        for name in (
+            INJECTION_MARKER,
+            "__di_code__",
+            "__di_wrapped__",
+            "__di_requirements__",
+            "__di_kinds__",
+        ):
+            setattr(pending_constructor, name, getattr(constructor_, name))
+        setattr(pending_constructor, "__di_pending__", True)
+        return pending_constructor
+
+    def _build_constructor(
+        self,
+        class_: Type,
+        constructor: Callable,
+        requirements: Dict[str, InjectionWrapper],
+    ) -> Callable:
+        kinds = {
+            resource_name: di_storage.is_factory(resource_name)
+            for resource_name in _resource_names(requirements)
+        }
+        bindings = self._bind_entries(requirements)
+        instrumented = self.instrumented
+        if instrumented:
+            bindings.update(self._bind_stats(class_, requirements))
+        bundle = None
+        if (
+            class_.__dictoffset__
+            and not instrumented
+            and getattr(class_, "__di_bulk__", DiClassInjector.bulk_by_default)
+        ):
+            bundle = self._bundle(class_, requirements, kinds)
+            bindings["_bundle"] = bundle
+        if constructor is DiClassInjector.call_parent:
+            constructor_call = "parent"
+        elif constructor is object.__init__:
+            constructor_call = "none"
+        else:
+            constructor_call = "constructor"
+        code, compiled = self._cached_code(
+            class_,
+            (
+                "injected_constructor",
+                _requirements_key(requirements),
+                tuple(sorted(kinds.items())),
+                None if bundle is None else tuple(bundle),
+                constructor_call,
+                instrumented,
+            ),
+            lambda: self._assemble_code(
+                requirements, constructor, kinds, bundle, instrumented
+            ),
+        )
+        constructor_ = self._compile_wrapper(
+            code, constructor, class_, bindings=bindings, compiled=compiled
+        )
 
         setattr(constructor_, INJECTION_MARKER, class_)
         setattr(constructor_, "__di_code__", code)
         setattr(constructor_, "__di_wrapped__", constructor)
+        setattr(constructor_, "__di_requirements__", requirements)
+        setattr(constructor_, "__di_kinds__", kinds)
+        setattr(constructor_, "__di_bundle__", bundle)
         return constructor_
 
+    @classmethod
+    def _bundle(
+        cls,
+        class_: Type,
+        requirements: Dict[str, InjectionWrapper],
+        kinds: Dict[str, Optional[bool]],
+    ) -> Dict[str, object]:
+        """The registered non-factory resources, by field name, to be copied in the instance with a single update.
+        Fields stored in slots are excluded."""
+        bundle = {}
+        for field_name, requirement in requirements.items():
+            if slot_descriptor(class_, field_name) is not None:
+                continue
+            resource_name = requirement.name or field_name
+            is_factory = kinds[resource_name]
+            if is_factory is False or (
+                requirement.force_no_factory and is_factory is not None
+            ):
+                bundle[field_name] = di_storage.entry(resource_name).value
+        return bundle
+
+    def freeze_constructor(self, class_: Type) -> Callable:
+        """Builds a constructor for an already injected class where the currently registered resources are bound as
+        closure constants and the factory checks are resolved at compile time"""
+        constructor_ = class_.__dict__["__init__"]
+        if getattr(constructor_, "__di_frozen__", False):
+            return constructor_
+
+        requirements = constructor_.__di_requirements__
+        constructor = constructor_.__di_wrapped__
+        bindings = {}
+        code = self._assemble_frozen_code(requirements, constructor, bindings)
+        frozen_constructor = self._compile_wrapper(
+            code, constructor, class_, function_name="make_injected_constructor"
+        )(**bindings)
+
+        setattr(frozen_constructor, INJECTION_MARKER, class_)
+        setattr(frozen_constructor, "__di_code__", code)
+        setattr(frozen_constructor, "__di_wrapped__", constructor)
+        setattr(frozen_constructor, "__di_requirements__", requirements)
+        setattr(frozen_constructor, "__di_frozen__", True)
+        return frozen_constructor
+
+    def wrap_lazy_getter(
+        self, class_: Type, field_name: str, requirement: InjectionWrapper
+    ) -> Callable:
+        code, compiled = self._cached_code(
+            class_,
+            ("lazy_getter", _requirements_key({field_name: requirement})),
+            lambda: self._assemble_lazy_getter_code(field_name, requirement),
+        )
+        getter = self._compile_wrapper(
+            code,
+            object.__init__,
+            class_,
+            function_name="lazy_getter",
+            bindings=self._bind_entries({field_name: requirement}),
+            compiled=compiled,
+        )
+        setattr(getter, "__di_code__", code)
+        return getter
+
+    def build_handle(self, resource_name: str) -> Callable:
+        """Builds a callable resolving the resource, bound to its storage entry so that it follows re-registrations"""
+        code = self._assemble_handle_code()
+        handle = self._compile_wrapper(
+            code,
+            object.__init__,
+            object,
+            function_name="resolve",
+            bindings={"_entry": di_storage.entry(resource_name)},
+        )
+        setattr(handle, "__di_code__", code)
+        handle.__qualname__ = f"resolve[{resource_name}]"
+        return handle
+
     @classmethod
     def _assemble_code(
         cls,
         requirements: Dict[str, InjectionWrapper],
         constructor,
+        kinds: Optional[Dict[str, Optional[bool]]] = None,
+        bundle: Optional[Dict[str, object]] = None,
+        instrumented: bool = False,
     ) -> str:
+        """
+        :arg kinds tells, for each resource name, whether it's currently registered as a factory; resources that are
+            known get a specialised assignment, the others (or all of them, if missing) check the factory flag at
+            runtime
+        :arg bundle the fields copied in the instance dictionary with a single update, bound as `_bundle`
+        :arg instrumented counts the resolutions of each field in `_stats_{field}`, times the factory calls and the
+            whole injection, in `_class_stats`, with `_perf_counter_ns`
+        """
+        kinds = kinds or {}
+        bundle = bundle or {}
         code = "def injected_constructor(self, *params, **kwargs):\n"
-        code += "    try:\n"
+        if instrumented:
+            code += "    _start = _perf_counter_ns()\n"
+        if bundle:
+            code += "    self.__dict__.update(_bundle)\n"
+        if len(bundle) < len(requirements):
+            code += cls._assemble_assignments(requirements, kinds, bundle, instrumented)
+        if instrumented:
+            code += "    _class_stats.constructed(_perf_counter_ns() - _start)\n"
+        if constructor is DiClassInjector.call_parent:
+            code += "    super(class_, self).__init__(*params, **kwargs)\n"
+        elif constructor is not object.__init__:  # do not call object's constructor
+            code += "    constructor(self, *params, **kwargs)\n"
+
+        return code
+
+    @classmethod
+    def _assemble_assignments(
+        cls,
+        requirements: Dict[str, InjectionWrapper],
+        kinds: Dict[str, Optional[bool]],
+        bundle: Dict[str, object],
+        instrumented: bool = False,
+    ) -> str:
+        code = "    try:\n"
         for key, requirement in requirements.items():
-            key_ref, is_factory_key = di_storage.keys(requirement.name or key)
-            code += f"        self.{key} = di_storage.{key_ref}\n"
-            if not requirement.force_no_factory:
-                code += f"        if di_storage.{is_factory_key}:\n"
-                code += f"           self.{key} = self.{key}()\n"
+            if key in bundle:
+                continue
+            is_factory = kinds.get(requirement.name or key)
+            if is_factory is None and not requirement.force_no_factory:
+                code += f"        _value, _is_factory = _entry_{key}.binding\n"
+                if instrumented:
+                    code += "        if _is_factory:\n"
+                    code += cls._assemble_factory_call(key, "_value", "    ")
+                    code += "        else:\n"
+                    code += f"            self.{key} = _value\n"
+                    code += f"            _stats_{key}.resolutions += 1\n"
+                else:
+                    code += (
+                        f"        self.{key} = _value() if _is_factory else _value\n"
+                    )
+                continue
+            if is_factory and not requirement.force_no_factory:
+                if instrumented:
+                    code += cls._assemble_factory_call(key, f"_entry_{key}.factory")
+                else:
+                    code += f"        self.{key} = _entry_{key}.factory()\n"
+                continue
+            if is_factory is False:
+                code += f"        self.{key} = _entry_{key}.instance\n"
+            elif is_factory:
+                code += f"        self.{key} = _entry_{key}.factory\n"
+            else:
+                code += f"        self.{key} = _entry_{key}.binding[0]\n"
+            if instrumented:
+                code += f"        _stats_{key}.resolutions += 1\n"
         code += "    except AttributeError as e:\n"
         code += "        raise UndefinedResourceException(\n"
         code += "              f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e\n"
+        return code
+
+    @classmethod
+    def _assemble_factory_call(cls, key: str, factory: str, indent: str = "") -> str:
+        code = f"{indent}        _factory_start = _perf_counter_ns()\n"
+        code += f"{indent}        self.{key} = {factory}()\n"
+        code += f"{indent}        _stats_{key}.factory_called(_perf_counter_ns() - _factory_start)\n"
+        return code
+
+    @classmethod
+    def _assemble_frozen_code(
+        cls,
+        requirements: Dict[str, InjectionWrapper],
+        constructor,
+        bindings: Dict[str, object],
+    ) -> str:
+        body = ""
+        for key, requirement in requirements.items():
+            resource_name = requirement.name or key
+            # the constructors are shared by all the contexts: a scope active while freezing must not leak into them
+            binding = di_storage.global_binding(resource_name)
+            if binding is None:
+                # bound rather than written in the source: the name may contain quotes or braces
+                bindings[f"_di_{key}"] = resource_name
+                body += "        raise UndefinedResourceException(\n"
+                body += f"              f'`{{_di_{key}}}` Needed by class {{self.__class__.__name__}}')\n"
+                continue
+            value, is_factory = binding
+            bindings[f"_di_{key}"] = value
+            if not requirement.force_no_factory and is_factory:
+                body += f"        self.{key} = _di_{key}()\n"
+            else:
+                body += f"        self.{key} = _di_{key}\n"
         if constructor is DiClassInjector.call_parent:
-            code += "    super(class_, self).__init__(*params, **kwargs)\n"
-        elif constructor is not object.__init__:  # do not call object's constructor
-            code += "    constructor(self, *params, **kwargs)\n"
+            body += "        super(class_, self).__init__(*params, **kwargs)\n"
+        elif constructor is not object.__init__:
+            body += "        constructor(self, *params, **kwargs)\n"
 
+        code = f"def make_injected_constructor({', '.join(bindings)}):\n"
+        code += "    def injected_constructor(self, *params, **kwargs):\n"
+        code += body or "        pass\n"
+        code += "    return injected_constructor\n"
         return code
 
+    @classmethod
+    def _assemble_lazy_getter_code(
+        cls, field_name: str, requirement: InjectionWrapper
+    ) -> str:
+        code = "def lazy_getter(self):\n"
+        code += "    try:\n"
+        code += f"        value, is_factory = _entry_{field_name}.binding\n"
+        if not requirement.force_no_factory:
+            code += "        if is_factory:\n"
+            code += "           value = value()\n"
+        code += "    except AttributeError as e:\n"
+        code += "        raise UndefinedResourceException(\n"
+        code += "              f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e\n"
+        code += f"    self.{field_name} = value\n"
+        code += "    return value\n"
+        return code
+
+    @classmethod
+    def _assemble_handle_code(cls) -> str:
+        code = "def resolve():\n"
+        code += "    try:\n"
+        code += "        value, is_factory = _entry.binding\n"
+        code += "    except AttributeError as e:\n"
+        code += "        raise UndefinedResourceException(e.args[0]) from e\n"
+        code += "    if is_factory:\n"
+        code += "        return value()\n"
+        code += "    return value\n"
+        return code
+
+    @classmethod
+    def _bind_entries(
+        cls, requirements: Dict[str, InjectionWrapper]
+    ) -> Dict[str, di_storage.Entry]:
+        return {
+            f"_entry_{key}": di_storage.entry(requirement.name or key)
+            for key, requirement in requirements.items()
+        }
+
+    @classmethod
+    def _bind_stats(
+        cls, class_: Type, requirements: Dict[str, InjectionWrapper]
+    ) -> Dict[str, object]:
+        bindings = {
+            f"_stats_{key}": metrics.resource_stats(requirement.name or key)
+            for key, requirement in requirements.items()
+        }
+        bindings["_class_stats"] = metrics.class_stats(class_)
+        bindings["_perf_counter_ns"] = perf_counter_ns
+        return bindings
+
+    @classmethod
+    def _cached_code(
+        cls, class_: Type, key: tuple, assemble: Callable[[], str]
+    ) -> Tuple[str, Optional[CodeType]]:
+        """
+        Returns the code of a generated function, and the compiled code object when the persistent cache is enabled.
+
+        :arg key everything the assembled code depends on, the first item being the name of the generated function
+        """
+        code_cache = cls.code_cache
+        if code_cache is None:
+            return assemble(), None
+        cache_key = repr((class_.__qualname__, key))
+        cached = code_cache.get(class_.__module__, cache_key)
+        if cached is not None:
+            return cached
+        code = assemble()
+        compiled = compile(code, key[0], "exec")
+        code_cache.put(class_.__module__, cache_key, code, compiled)
+        return code, compiled
+
     @classmethod
     def _compile_wrapper(
-        cls, code: str, constructor: Callable, class_: Type
+        cls,
+        code: str,
+        constructor: Callable,
+        class_: Type,
+        function_name: str = "injected_constructor",
+        bindings: Optional[Dict[str, object]] = None,
+        compiled: Optional[CodeType] = None,
     ) -> Callable:
-
-        the_code = compile(code, "injected_constructor", "exec")
+        profile = DiModuleInjector.profile
+        start = 0 if profile is None else perf_counter_ns()
+        the_code = compiled or compile(code, function_name, "exec")
         _locals = {}
         _globals = {
-            "di_storage": di_storage,
+            **(bindings or {}),
             "constructor": constructor,
             "_logger": _logger,
             "class_": class_,
@@ -204,5 +1035,7 @@ class ConstructorWrapper:
         # pylint: disable=eval-used
         eval(the_code, _globals, _locals)  # nosec
         # We are evaluating code generated by our own function
-        injected_constructor = _locals["injected_constructor"]
+        injected_constructor = _locals[function_name]
+        if profile is not None and class_ is not object:
+            profile.compiled(class_, perf_counter_ns() - start)
         return injected_constructor
@@ -0,0 +1,83 @@
+import threading
+from enum import Enum
+from typing import Callable
+
+from easy_di import di_storage
+from easy_di.exceptions import DependencyCycleException
+from easy_di.injection import DiClassInjector
+
+
+class Lifetime(str, Enum):
+    """How long the object built by a factory resource lives"""
+
+    TRANSIENT = "transient"  # the factory is called for every injection
+    SINGLETON = "singleton"  # the factory is called once, the result is shared
+    THREAD = "thread"  # the factory is called once per thread
+
+
+_NOT_BUILT = object()
+
+
+def materialize(resource_name: str, factory: Callable, instance):
+    """Replaces the singleton factory, once built, with its instance in the storage, unless re-registered in the
+    meanwhile"""
+    with di_storage.registration_lock:
+        if di_storage.replace(resource_name, factory, instance):
+            DiClassInjector.consumers_index.resource_changed(resource_name)
+
+
+class SingletonFactory:
+    """Calls the factory once and then replaces itself in the storage with the built object, so that the following
+    injections take the non-factory path"""
+
+    def __init__(self, resource_name: str, factory: Callable):
+        self.resource_name = resource_name
+        self.factory = factory
+        self._instance = _NOT_BUILT
+        # reentrant, so that a factory needing its own resource fails instead of deadlocking
+        self._lock = threading.RLock()
+        self._building = False
+
+    def __call__(self):
+        if self._instance is _NOT_BUILT:
+            with self._lock:
+                if self._instance is _NOT_BUILT:
+                    if self._building:
+                        # only the building thread holds the lock
+                        raise DependencyCycleException(
+                            f"`{self.resource_name}` is needed by its own factory"
+                        )
+                    self._building = True
+                    try:
+                        self._instance = self.factory()
+                    finally:
+                        self._building = False
+                    materialize(self.resource_name, self, self._instance)
+        return self._instance
+
+
+class ThreadLocalFactory:
+    """Calls the factory once per thread, caching the result in thread-local storage"""
+
+    # called on every access by the shared fields, see `SharedInjection`
+    __di_per_thread__ = True
+
+    def __init__(self, resource_name: str, factory: Callable):
+        self.resource_name = resource_name
+        self.factory = factory
+        self._local = threading.local()
+
+    def __call__(self):
+        try:
+            return self._local.instance
+        except AttributeError:
+            instance = self._local.instance = self.factory()
+            return instance
+
+
+def wrap_factory(resource_name: str, factory: Callable, lifetime: Lifetime) -> Callable:
+    if lifetime is Lifetime.SINGLETON:
+        return SingletonFactory(resource_name, factory)
+    if lifetime is Lifetime.THREAD:
+        return ThreadLocalFactory(resource_name, factory)
+    return factory
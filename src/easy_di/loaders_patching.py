@@ -1,124 +1,109 @@
-import functools
-from importlib.abc import Loader
+import sys
+from time import perf_counter_ns
 
 from easy_di.injection import DiModuleInjector
 
-# Copied and modified from
-# https://github.com/brettlangdon/importhook   (MIT Licence)
 
-
-class InjectedMetaPaths(list):
-    """
-    Custom list that will ensure any items added are wrapped as a "hooked" finder
-    This class is made to replace `sys.meta_paths`
+class InjectionFinder:
     """
+    Meta path finder, installed first in `sys.meta_path`, that delegates to the following finders and makes sure the
+    loaded modules are patched for DI.
 
-    def __init__(self, finders):
-        super().__init__([_injection_patch(f) for f in finders])
+    Only the specs of the modules in `DiModuleInjector.scope` get their loader wrapped: for any other module it returns
+    None right away, and the import goes on as if the finder wasn't there.
 
-    def __setitem__(self, key, val):
-        super().__setitem__(key, _injection_patch(val))
+    It implements the `importlib.abc.MetaPathFinder` protocol without inheriting from it: `importlib.abc` is slow to
+    import.
+    """
 
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in DiModuleInjector.scope:
+            return None
+        spec = self._delegate_find_spec(fullname, path, target)
+        if spec is None or spec.loader is None:
+            return spec
+        if hasattr(spec.loader, "exec_module"):
+            spec.loader = _InjectionPatchLoader(spec.loader)
+        else:
+            spec.loader = _LegacyInjectionPatchLoader(spec.loader)
+        return spec
 
-class _InjectionPatchLoader(Loader):
+    def _delegate_find_spec(self, fullname, path, target):
+        found_self = False
+        for finder in sys.meta_path:
+            if not found_self:
+                found_self = finder is self
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is not None:
+                spec = find_spec(fullname, path, target)
+            else:
+                # finders predating PEP 451, still supported by the import system up to python 3.11
+                find_module = getattr(finder, "find_module", None)
+                if find_module is None:
+                    continue
+                loader = find_module(fullname, path)
+                if loader is None:
+                    continue
+                from importlib.util import spec_from_loader
+
+                spec = spec_from_loader(fullname, loader)
+            if spec is not None:
+                return spec
+        return None
+
+    def invalidate_caches(self):
+        pass
+
+
+class _InjectionPatchLoader:
     """
-    Custom `importlib.abc.Loader` which ensures we modify all constructors that require injection when a module is
-    loaded.
+    Custom loader which ensures we modify all constructors that require injection when a module is
+    loaded. Everything else is delegated to the wrapped loader.
     """
 
-    loader: Loader
-
     def __init__(self, loader):
-        if not loader:
-            raise RuntimeError("Empty loader")
         self.loader = loader
 
-    def module_repr(self, module):
-        return self.loader.module_repr(module)
+    def __getattr__(self, name):
+        # Only called for the attributes not defined here: `get_source`, `get_resource_reader`, `is_package`...
+        return getattr(self.loader, name)
 
-    def __getattribute__(self, name):
-        # If they are requesting the "loader" attribute, return it right away
-        loader = super().__getattribute__("loader")
+    def create_module(self, spec):
+        create_module = getattr(self.loader, "create_module", None)
+        return None if create_module is None else create_module(spec)
 
-        if name == "loader":
-            return loader
+    def exec_module(self, module):
+        profile = DiModuleInjector.profile
+        if profile is None:
+            self.loader.exec_module(module)
+        else:
+            start = perf_counter_ns()
+            self.loader.exec_module(module)
+            profile.module_executed(module.__name__, perf_counter_ns() - start)
+        DiModuleInjector().inject_scoped(module)
 
-        # Pass through attributes/methods only if they exist on the underlying loader
-        if hasattr(loader, name):
-            try:
-                return super().__getattribute__(name)
-            except AttributeError:
-                return getattr(loader, name)
 
-        raise AttributeError(f"Can't get attribute of loader: {name}")
+class _LegacyInjectionPatchLoader:
+    """Same as `_InjectionPatchLoader`, for the loaders only implementing `load_module`"""
 
-    def create_module(self, spec):
-        if not hasattr(self.loader, "create_module"):
-            return None
+    def __init__(self, loader):
+        self.loader = loader
 
-        return self.loader.create_module(spec)
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
 
     def load_module(self, fullname):
-        if not hasattr(self.loader, "load_module"):
-            return None
-
         module = self.loader.load_module(fullname)
-        if module is None:
-            return None
-
-        DiModuleInjector().inject(module)
-
+        DiModuleInjector().inject_scoped(module)
         return module
 
-    def exec_module(self, module):
-        if not hasattr(self.loader, "exec_module"):
-            return None
-
-        mod = self.loader.exec_module(module)
-        if mod is not None:
-            module = mod
 
-        DiModuleInjector().inject(module)
-
-        return module
-
-
-def _injection_patch(finder):
-    """
-    Helper function to create a new "hooked" subclass of the provided finder class
-    This function replaces the `Finder.find_spec` function to ensure that any ModuleSpecs will
-    use an `InjectionPatchLoader`
-    """
-    # If this finder has already been wrapped, then return as-is
-    if hasattr(finder, "__wrapped_for_injection__"):
-        return finder
-
-    # Override the functions we care about
-    if hasattr(finder, "find_spec"):
-        setattr(finder, "find_spec", _wrap_find_spec(finder.find_spec))
-    if hasattr(finder, "find_loader"):
-        setattr(finder, "find_loader", _wrap_find_loader(finder.find_loader))
-
-    # Make this finder as being wrapped
-    setattr(finder, "__wrapped_for_injection__", True)
+def install_finder() -> InjectionFinder:
+    """Puts the `InjectionFinder` first in `sys.meta_path`, if it's not there yet"""
+    for finder in sys.meta_path:
+        if isinstance(finder, InjectionFinder):
+            return finder
+    finder = InjectionFinder()
+    sys.meta_path.insert(0, finder)
     return finder
-
-
-def _wrap_find_loader(find_loader):
-    @functools.wraps(find_loader)
-    def wrapper(fullname, path):
-        loader = find_loader(fullname, path)
-        return _InjectionPatchLoader(loader)
-
-    return wrapper
-
-
-def _wrap_find_spec(find_spec):
-    @functools.wraps(find_spec)
-    def wrapper(fullname, path, target=None):
-        spec = find_spec(fullname, path, target=target)
-        if spec is not None and spec.loader is not None:
-            spec.loader = _InjectionPatchLoader(spec.loader)
-        return spec
-
-    return wrapper
@@ -1,7 +1,13 @@
+import os
 import sys
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
-from easy_di.injection import DiModuleInjector
-from easy_di.loaders_patching import InjectedMetaPaths
+from easy_di.injection import ConstructorWrapper, DiModuleInjector, ModuleScope
+from easy_di.loaders_patching import install_finder
+
+if TYPE_CHECKING:
+    from easy_di.manifest import Manifest
 
 
 class _StaticData:
@@ -16,22 +22,75 @@ class _StaticData:
         cls._initialized = True
 
 
-def di_init():
-    """We make sure all the Finders in the sys.meta_path are patched so that every loaded module is patched for
-    DI if required"""
+def di_init(
+    packages: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    manifest: Union[None, str, "Manifest"] = None,
+    code_cache: bool = False,
+    profile: Union[bool, str] = False,
+):
+    """We install a finder at the head of sys.meta_path so that every loaded module is patched for DI if required, and
+    the first call inspects the modules loaded so far
+
+    :arg packages if given, only the modules in these packages (and their subpackages) are inspected
+    :arg exclude modules and packages that are never inspected
+    :arg manifest a Manifest, or the path of a manifest generated with `python -m easy_di manifest`: only the modules
+        and classes it lists are inspected, `packages` and `exclude` are ignored
+    :arg code_cache if True the generated constructors are compiled once and stored, like bytecode, for the following
+        process starts
+    :arg profile if True a report of the time spent injecting each module and class is written to stderr at exit; if
+        it's a path the report is written there, as JSON if the path ends with `.json`. The `EASY_DI_PROFILE`
+        environment variable does the same, with `1`, `true` or `yes` for stderr (`0`, `false` and `no` turn it off),
+        and also covers the modules imported before this call
+
+    The scope applies to the modules imported afterwards, so it's better to call this function before importing the
+    application modules."""
+    if manifest is not None:
+        from easy_di.manifest import Manifest
+
+        if not isinstance(manifest, Manifest):
+            manifest = Manifest.load(manifest)
+        DiModuleInjector.scope = manifest
+    elif packages is not None or exclude is not None:
+        DiModuleInjector.scope = ModuleScope(packages, exclude)
+    if code_cache and ConstructorWrapper.code_cache is None:
+        import atexit
+
+        from easy_di.code_cache import CodeCache
+
+        ConstructorWrapper.code_cache = CodeCache()
+        atexit.register(ConstructorWrapper.code_cache.flush)
+    if profile:
+        from easy_di import profiling
+
+        profiling.enable("1" if profile is True else profile)
     if _StaticData.is_initialized():
         return
 
-    sys.meta_path = InjectedMetaPaths(sys.meta_path[:])
+    install_finder()
     injector = DiModuleInjector()
+    start = perf_counter_ns()
 
     # Injecting already loaded modules
     loaded_modules = []
     for module in sys.modules.values():
         loaded_modules.append(module)
     for module in loaded_modules:
-        injector.inject(module)
+        injector.inject_scoped(module)
+    if DiModuleInjector.profile is not None:
+        DiModuleInjector.profile.sweep_ns += perf_counter_ns() - start
+    if ConstructorWrapper.code_cache is not None:
+        ConstructorWrapper.code_cache.flush()
     _StaticData.initialized()
 
 
-di_init()
+# Importing easy_di only installs the finder, which is cheap: the already loaded modules are inspected by the first
+# explicit `di_init` call. Applications injecting only `Injectable` classes can do without it
+if os.environ.get("EASY_DI_IMPORT_HOOK") != "0":
+    install_finder()
+_profile = os.environ.get("EASY_DI_PROFILE", "")
+if _profile.lower() not in ("", "0", "false", "no"):
+    from easy_di import profiling
+
+    # any other value than a flag is the path of the report
+    profiling.enable("1" if _profile.lower() in ("1", "true", "yes") else _profile)
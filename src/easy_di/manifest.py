@@ -0,0 +1,167 @@
+import ast
+import importlib.util
+import json
+import os
+from types import ModuleType
+from typing import Dict, Iterable, List
+
+from easy_di.injection import ModuleScope
+
+MANIFEST_VERSION = 1
+
+# module name -> class name -> injected fields
+Modules = Dict[str, Dict[str, List[str]]]
+
+
+class Manifest(ModuleScope):
+    """The modules and classes needing injection, found by a static scan of the sources: used as scope, only the
+    listed modules are inspected, and only the listed classes are looked up in them"""
+
+    def __init__(self, modules: Modules):
+        super().__init__()
+        self.modules = modules
+
+    def __contains__(self, module_name: str) -> bool:
+        return module_name in self.modules
+
+    def __eq__(self, other):
+        return isinstance(other, Manifest) and self.modules == other.modules
+
+    def candidates(self, module: ModuleType) -> Iterable:
+        module_dict = module.__dict__
+        return [
+            module_dict[class_name]
+            for class_name in self.modules.get(module.__name__, ())
+            if class_name in module_dict
+        ]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"version": MANIFEST_VERSION, "modules": self.modules},
+            indent=2,
+            sort_keys=True,
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "Manifest":
+        content = json.loads(data)
+        if content.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {content.get('version')}")
+        return cls(content["modules"])
+
+    @classmethod
+    def load(cls, path: str) -> "Manifest":
+        with open(path, encoding="utf-8") as manifest_file:
+            return cls.from_json(manifest_file.read())
+
+    def diff(self, other: "Manifest") -> List[str]:
+        """Human readable differences between this manifest and another one"""
+        differences = []
+        for module_name in sorted(set(self.modules) | set(other.modules)):
+            classes = self.modules.get(module_name, {})
+            other_classes = other.modules.get(module_name, {})
+            for class_name in sorted(set(classes) | set(other_classes)):
+                fields = classes.get(class_name)
+                other_fields = other_classes.get(class_name)
+                if fields != other_fields:
+                    differences.append(
+                        f"{module_name}.{class_name}: {fields} != {other_fields}"
+                    )
+        return differences
+
+
+class ManifestScanner:
+    """Finds the classes with `injected` annotations parsing the sources of a package, without importing its modules"""
+
+    INJECTED_MODULES = {"easy_di", "easy_di.injection"}
+
+    def scan_package(self, package_name: str) -> Manifest:
+        spec = importlib.util.find_spec(package_name)
+        if spec is None:
+            raise ModuleNotFoundError(package_name)
+        modules: Modules = {}
+        if spec.submodule_search_locations is None:
+            self._scan_file(spec.origin, package_name, modules)
+            return Manifest(modules)
+        for location in spec.submodule_search_locations:
+            self._scan_directory(location, package_name, modules)
+        return Manifest(modules)
+
+    def _scan_directory(self, directory: str, package_name: str, modules: Modules):
+        for entry in sorted(os.scandir(directory), key=lambda entry_: entry_.name):
+            if entry.is_dir():
+                if os.path.exists(os.path.join(entry.path, "__init__.py")):
+                    self._scan_directory(
+                        entry.path, f"{package_name}.{entry.name}", modules
+                    )
+            elif entry.name == "__init__.py":
+                self._scan_file(entry.path, package_name, modules)
+            elif entry.name.endswith(".py"):
+                self._scan_file(
+                    entry.path, f"{package_name}.{entry.name[:-3]}", modules
+                )
+
+    def _scan_file(self, path: str, module_name: str, modules: Modules):
+        with open(path, "rb") as source:
+            tree = ast.parse(source.read(), path)
+        classes = self.scan_module(tree)
+        if classes:
+            modules[module_name] = classes
+
+    def scan_module(self, tree: ast.Module) -> Dict[str, List[str]]:
+        names = self._injected_names(tree)
+        classes = {}
+        for class_def in self._module_classes(tree.body):
+            fields = [
+                statement.target.id
+                for statement in class_def.body
+                if isinstance(statement, ast.AnnAssign)
+                and isinstance(statement.target, ast.Name)
+                and self._is_injected(statement.annotation, names)
+            ]
+            if fields:
+                classes[class_def.name] = fields
+        return classes
+
+    @classmethod
+    def _injected_names(cls, tree: ast.Module):
+        names = {"injected"}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module in cls.INJECTED_MODULES:
+                for alias in node.names:
+                    if alias.name == "injected":
+                        names.add(alias.asname or alias.name)
+        return names
+
+    @classmethod
+    def _module_classes(cls, statements: List[ast.stmt]):
+        """Classes defined at module level, also inside if and try blocks"""
+        for statement in statements:
+            if isinstance(statement, ast.ClassDef):
+                yield statement
+            elif isinstance(statement, ast.If):
+                yield from cls._module_classes(statement.body)
+                yield from cls._module_classes(statement.orelse)
+            elif isinstance(statement, ast.Try):
+                for block in (statement.body, statement.orelse, statement.finalbody):
+                    yield from cls._module_classes(block)
+                for handler in statement.handlers:
+                    yield from cls._module_classes(handler.body)
+
+    @classmethod
+    def _is_injected(cls, annotation: ast.expr, names) -> bool:
+        for node in ast.walk(annotation):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                try:
+                    string_annotation = ast.parse(node.value, mode="eval")
+                except SyntaxError:
+                    continue
+                if cls._is_injected(string_annotation.body, names):
+                    return True
+            elif isinstance(node, ast.Call):
+                function = node.func
+                if (isinstance(function, ast.Name) and function.id in names) or (
+                    isinstance(function, ast.Attribute) and function.attr == "injected"
+                ):
+                    return True
+        return False
@@ -0,0 +1,125 @@
+import weakref
+from typing import Dict, NamedTuple, Type
+
+# histogram buckets by bit length of the duration in nanoseconds: bucket n holds the durations < 2**n ns
+_BUCKETS = 64
+
+
+class ResourceStats:
+    """How many times the injected constructors resolved the resource, and how long its factory took"""
+
+    __slots__ = ("resolutions", "factory_calls", "factory_ns", "buckets")
+
+    def __init__(self):
+        self.resolutions = 0
+        self.factory_calls = 0
+        self.factory_ns = 0
+        self.buckets = [0] * _BUCKETS
+
+    def factory_called(self, duration_ns: int):
+        self.resolutions += 1
+        self.factory_calls += 1
+        self.factory_ns += duration_ns
+        self.buckets[min(duration_ns.bit_length(), _BUCKETS - 1)] += 1
+
+    @property
+    def mean_factory_ns(self) -> float:
+        return self.factory_ns / self.factory_calls if self.factory_calls else 0.0
+
+    def histogram(self) -> Dict[int, int]:
+        """The factory calls by duration: the keys are the upper bounds, in nanoseconds, of the power of two buckets"""
+        return {
+            2**bucket: count for bucket, count in enumerate(self.buckets) if count
+        }
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound, in nanoseconds, of the bucket holding the given fraction (0.5, 0.99...) of the factory calls"""
+        threshold = fraction * self.factory_calls
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= threshold:
+                return 2**bucket
+        return 0
+
+    def copy(self) -> "ResourceStats":
+        copy = ResourceStats()
+        copy.resolutions = self.resolutions
+        copy.factory_calls = self.factory_calls
+        copy.factory_ns = self.factory_ns
+        copy.buckets = list(self.buckets)
+        return copy
+
+    def __repr__(self):
+        return (
+            f"ResourceStats(resolutions={self.resolutions}, factory_calls={self.factory_calls}, "
+            f"mean_factory_ns={self.mean_factory_ns:.0f})"
+        )
+
+
+class ClassStats:
+    """How many instances of the injected class were constructed, and the time spent injecting their fields"""
+
+    __slots__ = ("instances", "injection_ns")
+
+    def __init__(self):
+        self.instances = 0
+        self.injection_ns = 0
+
+    def constructed(self, duration_ns: int):
+        self.instances += 1
+        self.injection_ns += duration_ns
+
+    @property
+    def mean_injection_ns(self) -> float:
+        return self.injection_ns / self.instances if self.instances else 0.0
+
+    def copy(self) -> "ClassStats":
+        copy = ClassStats()
+        copy.instances = self.instances
+        copy.injection_ns = self.injection_ns
+        return copy
+
+    def __repr__(self):
+        return f"ClassStats(instances={self.instances}, mean_injection_ns={self.mean_injection_ns:.0f})"
+
+
+class Stats(NamedTuple):
+    """A snapshot of the figures collected since the instrumentation was enabled"""
+
+    resources: Dict[str, ResourceStats]
+    classes: Dict[Type, ClassStats]
+
+
+# The counters are updated without locks: concurrent constructions may lose some increments
+_resources: Dict[str, ResourceStats] = {}
+_classes: "weakref.WeakKeyDictionary[Type, ClassStats]" = weakref.WeakKeyDictionary()
+
+
+def resource_stats(resource_name: str) -> ResourceStats:
+    try:
+        return _resources[resource_name]
+    except KeyError:
+        return _resources.setdefault(resource_name, ResourceStats())
+
+
+def class_stats(class_: Type) -> ClassStats:
+    try:
+        return _classes[class_]
+    except KeyError:
+        return _classes.setdefault(class_, ClassStats())
+
+
+def snapshot() -> Stats:
+    return Stats(
+        {name: stats.copy() for name, stats in list(_resources.items())},
+        {class_: stats.copy() for class_, stats in list(_classes.items())},
+    )
+
+
+def reset():
+    """Zeroes the counters in place: the instrumented constructors keep their bindings"""
+    for stats in list(_resources.values()):
+        stats.__init__()
+    for stats in list(_classes.values()):
+        stats.__init__()
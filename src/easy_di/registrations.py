@@ -0,0 +1,50 @@
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+from easy_di.async_resources import wrap_async_factory
+from easy_di.lifetimes import Lifetime, wrap_factory
+
+
+class Registration(NamedTuple):
+    """The arguments of a registration: enough to repeat it, after a fork or in another process"""
+
+    resource_name: str
+    resolver: object
+    is_factory: bool = False
+    lifetime: Optional[Lifetime] = None
+    reset_after_fork: bool = False
+    is_async: bool = False
+
+    @property
+    def stored_as_factory(self) -> bool:
+        return self.is_factory or self.lifetime is not None or self.is_async
+
+    def build(self):
+        """The object to store: the resolver, or a new wrapper managing the lifetime of the objects it builds"""
+        if self.is_async:
+            return wrap_async_factory(self.resource_name, self.resolver, self.lifetime)
+        if self.lifetime is not None:
+            return wrap_factory(self.resource_name, self.resolver, self.lifetime)
+        return self.resolver
+
+
+class RegistrationSpec:
+    """
+    The registrations of a process, exported by `DI.export_spec` to be replayed by `DI.apply_spec` in the worker
+    processes, typically as initializer of a `ProcessPoolExecutor` or a `multiprocessing.Pool`.
+
+    It's pickled with the registered resolvers: the factories must be importable (classes, module functions) and the
+    values picklable. The singletons are exported as their factory, the workers build their own.
+    """
+
+    def __init__(self, registrations: Iterable[Registration]):
+        self.registrations: Tuple[Registration, ...] = tuple(registrations)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, RegistrationSpec)
+            and self.registrations == other.registrations
+        )
+
+    def __repr__(self):
+        names = ", ".join(r.resource_name for r in self.registrations)
+        return f"RegistrationSpec({names})"
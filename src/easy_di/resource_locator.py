@@ -1,14 +1,39 @@
-from unittest.mock import Mock
+import os
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Type
 
-from easy_di import di_storage
-from easy_di.exceptions import DuplicateResourceException, UndefinedResourceException
+from easy_di import di_storage, metrics
+from easy_di.async_resources import AsyncSingletonFactory, aresolve
+from easy_di.exceptions import (
+    DuplicateResourceException,
+    FrozenRegistryException,
+    UndefinedResourceException,
+)
+from easy_di.injection import ConstructorWrapper, DiClassInjector
+from easy_di.lifetimes import Lifetime
+from easy_di.registrations import Registration, RegistrationSpec
+from easy_di.warmup import warmup
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
 
 
 class DI:
     _initialized = False
+    _frozen = False
+    _handles: Dict[str, Callable] = {}
+    # the last global registration of each resource
+    _registrations: Dict[str, Registration] = {}
 
     @classmethod
-    def register(cls, resource_name, resolver, force=False, is_factory=False):
+    def register(
+        cls,
+        resource_name,
+        resolver,
+        force=False,
+        is_factory=False,
+        lifetime=None,
+        reset_after_fork=False,
+    ):
         """Registers a resource to be injected in needing objects.
 
         :type resource_name: six.text_type the resource name
@@ -16,16 +41,107 @@ class DI:
         be the injected object. Otherwise, the injected object will be 'resolver' itself.
         :type is_factory: boolean - if True, the resolver will be treated as if it were a callable object, even if it is
         not (usable for injecting factories), and be called for every new instance
+        :type lifetime: Lifetime|str|None - makes the resolver a factory and sets how long the objects it builds live:
+        `transient` (called for every new instance, same as is_factory=True), `singleton` (called once, then the
+        result is injected everywhere) or `thread` (called once per thread)
+        :type reset_after_fork: bool - in the processes forked afterwards the registration is repeated, so that the
+        objects built in the parent, like sockets or connection pools, are built again by the child. Only for factories:
+        raises ValueError without `is_factory` or `lifetime`
 
         :type force: bool overwrites previously registered resolvers, set to True only in test
+
+        Inside a `DI.scope()` block the resource is registered in the scope only, overriding the global one.
         """
-        if cls.exists(resource_name) and not force:
-            raise DuplicateResourceException(resource_name)
-        di_storage.store(resource_name, resolver, is_factory)
+        if reset_after_fork and not is_factory and lifetime is None:
+            raise ValueError(
+                f"`{resource_name}` is not a factory: a child process could only get the object of the parent"
+            )
+        cls._register(
+            Registration(
+                resource_name,
+                resolver,
+                bool(is_factory),
+                None if lifetime is None else Lifetime(lifetime),
+                reset_after_fork,
+            ),
+            force,
+        )
+
+    @classmethod
+    def _register(cls, registration: Registration, force: bool):
+        resource_name = registration.resource_name
+        scope = di_storage.current_scope()
+        if scope is not None:
+            # the scope belongs to the current context: only making the entry scoped is shared
+            if cls._frozen:
+                raise FrozenRegistryException(resource_name)
+            if resource_name in scope.overrides and not force:
+                raise DuplicateResourceException(resource_name)
+            # the constructors can't be specialised on the kind of a scoped resource anymore
+            di_storage.store_scoped(
+                scope,
+                resource_name,
+                registration.build(),
+                registration.stored_as_factory,
+                DiClassInjector.consumers_index.resource_changed,
+            )
+            return
+        with di_storage.registration_lock:
+            if cls._frozen:
+                raise FrozenRegistryException(resource_name)
+            if cls.exists(resource_name) and not force:
+                raise DuplicateResourceException(resource_name)
+            di_storage.store(
+                resource_name, registration.build(), registration.stored_as_factory
+            )
+            cls._registrations[resource_name] = registration
+            DiClassInjector.consumers_index.resource_changed(resource_name)
+
+    @classmethod
+    def scope(cls) -> di_storage.Scope:
+        """Returns a context manager: the resources registered in the `with` block override the global ones, or the
+        enclosing scope ones, for the code running in the block, and are dropped at its end.
+
+        Scopes are bound to the current context, like `contextvars`: concurrent requests served by different threads
+        or asyncio tasks can each have their own. The constructors keep reading the resources directly until one is
+        registered in a scope, then they look up the current scope first for that resource only."""
+        return di_storage.Scope()
 
     @classmethod
-    def register_mock(cls, resource_name) -> Mock:
+    def register_async(
+        cls,
+        resource_name,
+        factory: Callable[[], Awaitable],
+        force=False,
+        lifetime=Lifetime.SINGLETON,
+        reset_after_fork=False,
+    ):
+        """Registers a resource built by a coroutine function, like an HTTP session or a connection pool.
+
+        :type factory: called with no parameters, the awaitable it returns builds the resource
+        :type lifetime: Lifetime|str - `singleton` (awaited once, the concurrent tasks share the same build) or
+        `transient` (awaited for every resolution)
+        :type reset_after_fork: bool - see `register`
+
+        The resource is resolved by `await DI.aget` and by the `injected(..., awaitable=True)` fields; a singleton can be
+        injected in constructors too, once built by `aget` or `awarmup`."""
+        cls._register(
+            Registration(
+                resource_name,
+                factory,
+                lifetime=Lifetime(lifetime),
+                reset_after_fork=reset_after_fork,
+                is_async=True,
+            ),
+            force,
+        )
+
+    @classmethod
+    def register_mock(cls, resource_name) -> "Mock":
         """Used for unit testing: creates a mock, registers it as a resource and returns it"""
+        # imported here: unittest.mock is slow to import, and not needed outside the tests
+        from unittest.mock import Mock
+
         mock = Mock()
         cls.register(resource_name, mock, force=True)
         return mock
@@ -35,18 +151,177 @@ class DI:
         """Resolves the resource. Usually you don't want to use this method, the @injected decorator does all the work.
 
         Sometimes you need to use the DI like it was a Resource Locator and this method allows something likely"""
-        try:
-            key, is_factory_key = di_storage.keys(resource_name)
-            resolved = getattr(di_storage, key)
-        except AttributeError as e:
+        entry = di_storage.lookup(resource_name)
+        if entry is None:
             if default is not None:
                 return default
-            raise UndefinedResourceException(resource_name) from e
-        if getattr(di_storage, is_factory_key):
-            resolved = resolved()
-        return resolved
+            raise UndefinedResourceException(resource_name)
+        value, is_factory = entry.binding
+        if is_factory:
+            return value()
+        return value
+
+    @classmethod
+    def warmup(cls, *resource_names, workers: Optional[int] = None) -> List[str]:
+        """Builds ahead of first use the given singletons, all the registered ones if no name is given, with the
+        singletons they depend on: the dependencies of a factory are the resources injected in its constructor, when
+        it's an injected class.
+
+        The resources are built on a pool of `workers` threads, each after its dependencies, the independent ones in
+        parallel. Raises, before building anything, UndefinedResourceException if some of the given resources are not
+        registered and DependencyCycleException if some resources depend on themselves.
+
+        :return the built resources, in build order"""
+        return warmup(resource_names or None, workers)
+
+    @classmethod
+    async def aget(cls, resource_name, default=None):
+        """Like `get`, awaiting the resources registered with `register_async`"""
+        return await aresolve(resource_name, default)
+
+    @classmethod
+    async def awarmup(cls, *resource_names):
+        """Builds, concurrently, the given async singletons, all the registered ones if no name is given, so that they
+        can be injected in constructors"""
+        import asyncio
+
+        if not resource_names:
+            resource_names = [
+                name
+                for name, entry in list(di_storage.entries.items())
+                if entry.version and isinstance(entry.binding[0], AsyncSingletonFactory)
+            ]
+        await asyncio.gather(*(aresolve(name) for name in resource_names))
+
+    @classmethod
+    def handle(cls, resource_name) -> Callable:
+        """Returns a callable with no parameters resolving the resource, like `get` but with less work per call.
+
+        The handle is bound to the resource, not to the registered object: it keeps working after the resource is
+        registered again, and raises UndefinedResourceException if it's called before the resource is registered"""
+        try:
+            return cls._handles[resource_name]
+        except KeyError:
+            return cls._handles.setdefault(
+                resource_name, ConstructorWrapper().build_handle(resource_name)
+            )
 
     @classmethod
     def exists(cls, resource_name):
-        key, _ = di_storage.keys(resource_name)
-        return getattr(di_storage, key, None) is not None
+        entry = di_storage.lookup(resource_name)
+        return entry is not None and entry.value is not None
+
+    @classmethod
+    def consumers(cls, resource_name) -> Dict[Type, List[str]]:
+        """Returns the injected classes needing the resource, with the fields it's injected into"""
+        return DiClassInjector.consumers_index.consumers(resource_name)
+
+    @classmethod
+    def enable_stats(cls):
+        """Recompiles the injected constructors with counters: how many times each resource is resolved, and how long
+        its factory takes, and how many instances of each class are built, and how long their injection takes. The
+        figures are read with `stats`, and restart from zero at every call.
+
+        Lazy and shared fields, `get` and the handles are not counted, nor the frozen constructors."""
+        metrics.reset()
+        cls._instrument(True)
+
+    @classmethod
+    def disable_stats(cls):
+        """Recompiles the injected constructors without counters: the instrumentation has no cost once disabled"""
+        cls._instrument(False)
+
+    @classmethod
+    def stats(cls) -> metrics.Stats:
+        """A snapshot of the figures collected since `enable_stats`, by resource name and by injected class"""
+        return metrics.snapshot()
+
+    @classmethod
+    def _instrument(cls, enabled: bool):
+        wrapper = ConstructorWrapper()
+        with di_storage.registration_lock:
+            ConstructorWrapper.instrumented = enabled
+            for class_ in list(DiClassInjector.injected_classes):
+                if not getattr(class_.__dict__["__init__"], "__di_frozen__", False):
+                    class_.__init__ = wrapper.rewrap_constructor(class_)
+
+    @classmethod
+    def freeze(cls):
+        """Seals the registry once the application has registered all its resources: every injected constructor is
+        recompiled with the registered resources bound as constants, and any further `register` raises
+        FrozenRegistryException until `unfreeze` is called.
+
+        Classes injected after the freeze keep the generic constructor."""
+        wrapper = ConstructorWrapper()
+        with di_storage.registration_lock:
+            # all built before any is installed: a failure leaves the registry unfrozen
+            constructors = [
+                (class_, wrapper.freeze_constructor(class_))
+                for class_ in list(DiClassInjector.injected_classes)
+            ]
+            for class_, constructor in constructors:
+                class_.__init__ = constructor
+            cls._frozen = True
+
+    @classmethod
+    def unfreeze(cls):
+        """Restores the non-frozen constructors and allows registering resources again"""
+        wrapper = ConstructorWrapper()
+        with di_storage.registration_lock:
+            for class_ in list(DiClassInjector.injected_classes):
+                class_.__init__ = wrapper.rewrap_constructor(class_)
+            cls._frozen = False
+
+    @classmethod
+    def is_frozen(cls):
+        return cls._frozen
+
+    @classmethod
+    def export_spec(cls, *resource_names) -> RegistrationSpec:
+        """Exports the global registrations, of the given resources or of all of them, to be replayed in other processes
+        by `apply_spec`:
+
+            ProcessPoolExecutor(initializer=DI.apply_spec, initargs=(DI.export_spec(),))
+        """
+        if not resource_names:
+            return RegistrationSpec(cls._registrations.values())
+        try:
+            return RegistrationSpec(cls._registrations[name] for name in resource_names)
+        except KeyError as e:
+            raise UndefinedResourceException(e.args[0]) from e
+
+    @classmethod
+    def apply_spec(cls, spec: RegistrationSpec):
+        """Repeats the registrations exported by `export_spec`, replacing the registered resources"""
+        for registration in spec.registrations:
+            cls._register(registration, force=True)
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """Runs in the forked processes: repeats the registrations with `reset_after_fork`, dropping the objects built
+        by the parent"""
+        registrations = [r for r in cls._registrations.values() if r.reset_after_fork]
+        if not registrations:
+            return
+        frozen = cls._frozen
+        if frozen:
+            # the frozen constructors hold the parent objects
+            cls.unfreeze()
+        with di_storage.registration_lock:
+            for registration in registrations:
+                # globally, even if the fork happened in a scope
+                di_storage.store(
+                    registration.resource_name,
+                    registration.build(),
+                    registration.stored_as_factory,
+                )
+                DiClassInjector.consumers_index.resource_changed(
+                    registration.resource_name
+                )
+        if frozen:
+            cls.freeze()
+
+
+if hasattr(os, "register_at_fork"):
+    # pylint: disable=protected-access
+    os.register_at_fork(after_in_child=DI._reset_after_fork)
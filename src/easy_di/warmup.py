@@ -0,0 +1,165 @@
+import contextvars
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from easy_di import di_storage
+from easy_di.exceptions import DependencyCycleException, UndefinedResourceException
+from easy_di.injection import _resource_names
+from easy_di.lifetimes import SingletonFactory, ThreadLocalFactory
+
+
+def _factory_dependencies(factory: Callable) -> Set[str]:
+    """The resources the factory needs to build its object: when it's an injected class, the resources injected by its
+    constructor. Lazy and shared fields are resolved later, they are not dependencies"""
+    if not isinstance(factory, type):
+        return set()
+    requirements = getattr(factory.__init__, "__di_requirements__", None)
+    return _resource_names(requirements) if requirements else set()
+
+
+class DependencyGraph:
+    """The registered resources and the resources their factories need"""
+
+    def __init__(self, dependencies: Dict[str, Set[str]]):
+        self.dependencies = dependencies
+
+    @classmethod
+    def from_storage(cls) -> "DependencyGraph":
+        dependencies = {}
+        for name, entry in list(di_storage.entries.items()):
+            if not entry.version:
+                continue
+            factory, is_factory = entry.binding
+            if not is_factory:
+                continue
+            if isinstance(factory, (SingletonFactory, ThreadLocalFactory)):
+                factory = factory.factory
+            dependencies[name] = _factory_dependencies(factory)
+        return cls(dependencies)
+
+    def closure(self, resource_names: Iterable[str]) -> Set[str]:
+        """The resources and, recursively, their dependencies"""
+        closure = set()
+        pending = list(resource_names)
+        while pending:
+            name = pending.pop()
+            if name not in closure:
+                closure.add(name)
+                pending.extend(self.dependencies.get(name, ()))
+        return closure
+
+    def check_cycles(self, resource_names: Iterable[str]):
+        """Raises DependencyCycleException if some of the resources depend on themselves"""
+        done: Set[str] = set()
+        for name in resource_names:
+            if name in done:
+                continue
+            path: List[str] = []
+            on_path: Set[str] = set()
+            # iterative depth first visit: the stack holds the node and the iterator on its dependencies
+            stack = [(name, iter(sorted(self.dependencies.get(name, ()))))]
+            path.append(name)
+            on_path.add(name)
+            while stack:
+                node, dependencies = stack[-1]
+                dependency = next(dependencies, None)
+                if dependency is None:
+                    stack.pop()
+                    path.pop()
+                    on_path.discard(node)
+                    done.add(node)
+                elif dependency in on_path:
+                    cycle = path[path.index(dependency) :] + [dependency]
+                    raise DependencyCycleException(" -> ".join(cycle))
+                elif dependency not in done:
+                    stack.append(
+                        (
+                            dependency,
+                            iter(sorted(self.dependencies.get(dependency, ()))),
+                        )
+                    )
+                    path.append(dependency)
+                    on_path.add(dependency)
+
+
+def _pending_singletons(resource_names: Iterable[str]) -> Set[str]:
+    pending = set()
+    for name in resource_names:
+        entry = di_storage.lookup(name)
+        if entry is not None and isinstance(entry.value, SingletonFactory):
+            pending.add(name)
+    return pending
+
+
+def _build(resource_name: str):
+    value, is_factory = di_storage.entry(resource_name).binding
+    if is_factory:
+        value()
+
+
+def warmup(
+    resource_names: Optional[Iterable[str]] = None, workers: Optional[int] = None
+) -> List[str]:
+    """
+    Builds the singleton resources, and the singletons they depend on, on a thread pool: a resource is built once its
+    dependencies are, the independent ones in parallel.
+
+    :arg resource_names the resources to build, all the registered singletons if None; raises
+        UndefinedResourceException if one of them is not registered
+    :arg workers the size of the thread pool, see `ThreadPoolExecutor`
+    :return the built resources, in build order
+    """
+    # imported here: concurrent.futures is slow to import, and only needed at startup
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    graph = DependencyGraph.from_storage()
+    if resource_names is None:
+        resource_names = graph.dependencies
+    else:
+        resource_names = list(resource_names)
+        for name in resource_names:
+            if di_storage.lookup(name) is None:
+                raise UndefinedResourceException(name)
+    nodes = graph.closure(resource_names)
+    graph.check_cycles(sorted(nodes))
+    singletons = _pending_singletons(nodes)
+
+    # Kahn's algorithm: the resources that are not singletons, or already built, are done as soon as their
+    # dependencies are
+    missing = {name: set(graph.dependencies.get(name, ())) & nodes for name in nodes}
+    dependents: Dict[str, List[str]] = {name: [] for name in nodes}
+    for name, dependencies in missing.items():
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+    ready = sorted(name for name, dependencies in missing.items() if not dependencies)
+    built: List[str] = []
+
+    def done(name):
+        for dependent in dependents[name]:
+            missing[dependent].discard(name)
+            if not missing[dependent]:
+                ready.append(dependent)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {}
+        while ready or running:
+            while ready:
+                name = ready.pop()
+                if name in singletons:
+                    # The scope of the caller, if any, is visible to the workers
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, _build, name)] = name
+                else:
+                    done(name)
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for other in running:
+                        other.cancel()
+                    raise error
+                built.append(name)
+                done(name)
+    return built
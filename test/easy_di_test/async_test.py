@@ -0,0 +1,103 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from easy_di import DI, di_init
+from easy_di.async_resources import AsyncInjection
+from easy_di.exceptions import AsyncResourceException
+
+from .resources import Object1
+
+
+class AsyncResourcesTest(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        DI.register_async("async_session", self.build, force=True)
+
+    async def build(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("can't connect")
+        return Object1()
+
+    async def test_single_flight(self):
+        sessions = await asyncio.gather(*(DI.aget("async_session") for _ in range(10)))
+
+        self.assertEqual(1, self.calls)
+        self.assertEqual(1, len(set(map(id, sessions))))
+        self.assertIs(sessions[0], await DI.aget("async_session"))
+
+    async def test_sync_injection_once_built(self):
+        from .resources_18 import EagerConsumer
+
+        with self.assertRaises(AsyncResourceException):
+            EagerConsumer()
+        with self.assertRaises(AsyncResourceException):
+            DI.get("async_session")
+
+        session = await DI.aget("async_session")
+
+        self.assertIs(session, EagerConsumer().session)
+        self.assertIs(session, DI.get("async_session"))
+
+    async def test_awaitable_field(self):
+        from .resources_18 import AsyncConsumer
+
+        testing = AsyncConsumer()
+
+        self.assertIsInstance(AsyncConsumer.__dict__["session"], AsyncInjection)
+        self.assertIs(await testing.session, await AsyncConsumer().session)
+        self.assertEqual(1, self.calls)
+
+    async def test_transient(self):
+        DI.register_async("async_session", self.build, force=True, lifetime="transient")
+
+        first = await DI.aget("async_session")
+
+        self.assertIsNot(first, await DI.aget("async_session"))
+        self.assertEqual(2, self.calls)
+
+    async def test_awarmup(self):
+        DI.register_async("async_other", self.build, force=True)
+
+        await DI.awarmup()
+
+        self.assertIsInstance(DI.get("async_session"), Object1)
+        self.assertIsInstance(DI.get("async_other"), Object1)
+        self.assertEqual(2, self.calls)
+
+    async def test_failure_shared_then_retried(self):
+        self.failures = 1
+
+        results = await asyncio.gather(
+            *(DI.aget("async_session") for _ in range(3)), return_exceptions=True
+        )
+
+        self.assertEqual(1, self.calls)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertIsInstance(await DI.aget("async_session"), Object1)
+        self.assertEqual(2, self.calls)
+
+    async def test_cancelled_build_retried_by_waiters(self):
+        first = asyncio.ensure_future(DI.aget("async_session"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(DI.aget("async_session"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        self.assertIsInstance(await second, Object1)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(2, self.calls)
+
+    def test_thread_lifetime_not_supported(self):
+        with self.assertRaises(ValueError):
+            DI.register_async(
+                "async_session", self.build, force=True, lifetime="thread"
+            )
@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from easy_di_test.benchmarks import suite
+
+from easy_di import DI
+
+
+def results(**values) -> dict:
+    return {
+        "version": suite.RESULTS_VERSION,
+        "results": {
+            name: {"value": value, "unit": "ns"} for name, value in values.items()
+        },
+    }
+
+
+class BenchmarkSuiteTest(TestCase):
+    def test_injected_classes(self):
+        # pylint: disable=protected-access
+        suite._register_resources()
+        base = suite._injected_class("SuiteBase", [suite._resource("value", 0)])
+        child = suite._injected_class(
+            "SuiteChild", [suite._resource("factory", 0)], base
+        )
+
+        instance = child()
+
+        self.assertIs(DI.get(suite._resource("value", 0)), instance.suitebase_0)
+        self.assertIs(object, type(instance.suitechild_0))
+
+    def test_compare(self):
+        comparisons = suite.compare(
+            results(fast=100, slow=100, gone=5), results(fast=90, slow=150, new=7)
+        )
+
+        self.assertEqual(["fast", "gone", "new", "slow"], [c.name for c in comparisons])
+        self.assertIsNone(comparisons[1].ratio)
+        self.assertIsNone(comparisons[2].ratio)
+        self.assertEqual(["slow"], [c.name for c in suite.regressions(comparisons)])
+        self.assertEqual([], suite.regressions(comparisons, threshold=1.6))
+
+    def test_compare_unsupported_version(self):
+        with self.assertRaises(ValueError):
+            suite.compare({"version": 0, "results": {}}, results())
+
+    def test_compare_command_exit_code(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            current = os.path.join(directory, "current.json")
+            with open(baseline, "w", encoding="utf-8") as baseline_file:
+                json.dump(results(construct=100), baseline_file)
+            with open(current, "w", encoding="utf-8") as current_file:
+                json.dump(results(construct=130), current_file)
+
+            output = StringIO()
+            with redirect_stdout(output):
+                failed = suite.main(["compare", baseline, current])
+                passed = suite.main(
+                    ["compare", baseline, current, "--threshold", "1.5"]
+                )
+
+        self.assertEqual(1, failed)
+        self.assertEqual(0, passed)
+        self.assertIn("REGRESSION", output.getvalue())
@@ -14,12 +14,14 @@ class WithParameter:
         self.object_1 = object_1
 
 
+_entry_object_1 = di_storage.entry("object_1")
+
+
 class SameBehaviour:
     def __init__(self, *params, **kwargs):
         try:
-            self.object_1 = di_storage.__object_1__
-            if di_storage.__object_1_is_factory__:
-                self.object_1 = self.object_1()
+            value, is_factory = _entry_object_1.binding
+            self.object_1 = value() if is_factory else value
         except AttributeError as e:
             raise UndefinedResourceException(
                 f"`{e.args[0]}` Needed by class {self.__class__.__name__}"
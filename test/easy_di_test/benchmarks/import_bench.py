@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULE_TEMPLATE = """from easy_di import injected
+
+
+class Plain{index}:
+    def __init__(self, value=None):
+        self.value = value
+
+
+class Annotated{index}:
+    value: int = {index}
+
+    def method(self):
+        return self.value
+"""
+
+INJECTED_TEMPLATE = """
+
+class Injected{index}:
+    dependency: injected(object, "import_bench_dependency")
+"""
+
+IMPORTER = """import sys
+import time
+
+import easy_di
+from easy_di.loaders_patching import InjectionFinder
+
+if sys.argv[2] == "vanilla":
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, InjectionFinder)]
+start = time.perf_counter()
+for index in range(int(sys.argv[1])):
+    __import__(f"synthetic.module_{index}")
+print(time.perf_counter() - start)
+"""
+
+
+SWEEPER = """import sys
+import time
+
+import easy_di
+
+for index in range(int(sys.argv[1])):
+    __import__(f"synthetic.module_{index}")
+start = time.perf_counter()
+easy_di.di_init()
+print(time.perf_counter() - start)
+"""
+
+
+def write_modules(
+    directory: str, modules: int, injected_every: int = 10, postponed: bool = False
+):
+    """Writes the `synthetic` package, one module out of `injected_every` has a class needing injection.
+
+    :arg postponed if True the modules use postponed annotations: the injected ones are strings to resolve"""
+    package = os.path.join(directory, "synthetic")
+    os.makedirs(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    for index in range(modules):
+        source = MODULE_TEMPLATE.format(index=index)
+        if index % injected_every == 0:
+            source += INJECTED_TEMPLATE.format(index=index)
+        if postponed:
+            source = "from __future__ import annotations\n" + source
+        with open(os.path.join(package, f"module_{index}.py"), "w") as module_file:
+            module_file.write(source)
+    with open(os.path.join(directory, "importer.py"), "w") as importer_file:
+        importer_file.write(IMPORTER)
+    with open(os.path.join(directory, "sweeper.py"), "w") as sweeper_file:
+        sweeper_file.write(SWEEPER)
+
+
+def time_imports(directory: str, modules: int, mode: str) -> float:
+    """Seconds spent importing the synthetic modules in a new interpreter, with (`mode="di"`) or without the hook"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory] + sys.path))
+    output = subprocess.check_output(
+        [sys.executable, os.path.join(directory, "importer.py"), str(modules), mode],
+        env=env,
+    )
+    return float(output)
+
+
+def time_sweep(directory: str, modules: int) -> float:
+    """Seconds spent by the first `di_init` inspecting the synthetic modules, imported before it without the hook"""
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join([directory] + sys.path),
+        EASY_DI_IMPORT_HOOK="0",
+    )
+    output = subprocess.check_output(
+        [sys.executable, os.path.join(directory, "sweeper.py"), str(modules)],
+        env=env,
+    )
+    return float(output)
+
+
+def measure(modules: int = 2000, runs: int = 5):
+    """Best import time of `runs` interpreters, without and with the import hook"""
+    with tempfile.TemporaryDirectory() as directory:
+        write_modules(directory, modules)
+        vanilla, di = [], []
+        for _ in range(runs):
+            vanilla.append(time_imports(directory, modules, "vanilla"))
+            di.append(time_imports(directory, modules, "di"))
+    return min(vanilla), min(di)
+
+
+if __name__ == "__main__":
+    modules = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    time_vanilla, time_di = measure(modules)
+    print(f"{modules} modules")
+    print(f"vanilla: {time_vanilla:.3f}s")
+    print(f"easy_di: {time_di:.3f}s")
+    print(f"ratio:   {time_di / time_vanilla:.3f}")
@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, Tuple
+
+
+def _environment() -> Dict[str, str]:
+    return dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+
+def import_times(statement: str = "import easy_di") -> Dict[str, Tuple[int, int]]:
+    """Runs the statement in a new interpreter with `-X importtime`: for each imported module, its self and cumulative
+    import time in microseconds"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=_environment(),
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def interpreter_time(statement: str, runs: int = 5) -> float:
+    """Best wall clock time, in seconds, of a new interpreter running the statement"""
+    env = _environment()
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
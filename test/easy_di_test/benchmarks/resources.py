@@ -3,3 +3,7 @@ from easy_di import injected
 
 class Trivial:
     object_1: injected(object)
+
+
+class StressReader:
+    payload: injected(object, "stress_payload")
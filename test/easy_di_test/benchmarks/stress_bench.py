@@ -0,0 +1,104 @@
+import sys
+import threading
+import time
+from typing import List, NamedTuple, Tuple
+
+from easy_di_test.benchmarks.resources import StressReader
+
+from easy_di import DI, di_init
+
+
+class Payload:
+    pass
+
+
+class StressResult(NamedTuple):
+    built: int  # objects constructed by the readers
+    errors: int  # wrong resources seen by the readers
+    registrations: int
+    seconds: float  # measured, the readers may overrun the requested duration
+
+    @property
+    def throughput(self) -> float:
+        return self.built / self.seconds
+
+
+def make_payload():
+    return Payload()
+
+
+def _writer(stop: threading.Event, registrations: List[int]):
+    # alternates the kind of the resource: every registration rebuilds the constructor of the reader
+    count = 0
+    while not stop.is_set():
+        if count % 2:
+            DI.register("stress_payload", make_payload, force=True, is_factory=True)
+        else:
+            DI.register("stress_payload", Payload(), force=True)
+        count += 1
+    registrations.append(count)
+
+
+def _reader(stop: threading.Event, results: List[Tuple[int, int]]):
+    built = errors = 0
+    while not stop.is_set():
+        for _ in range(100):
+            # a torn read would give the factory itself, or call the instance
+            try:
+                if type(StressReader().payload) is not Payload:
+                    errors += 1
+                if type(DI.get("stress_payload")) is not Payload:
+                    errors += 1
+            except TypeError:
+                errors += 1
+        built += 100
+    results.append((built, errors))
+
+
+def stress(readers: int, seconds: float, writer: bool = True) -> StressResult:
+    """Constructs injected objects from `readers` threads for `seconds`, while another thread registers the resource
+    again and again, alternating factories and instances"""
+    di_init()
+    DI.register("stress_payload", Payload(), force=True)
+    stop = threading.Event()
+    results: List[Tuple[int, int]] = []
+    registrations: List[int] = []
+    threads = [
+        threading.Thread(target=_reader, args=(stop, results)) for _ in range(readers)
+    ]
+    if writer:
+        threads.append(threading.Thread(target=_writer, args=(stop, registrations)))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return StressResult(
+        sum(built for built, _ in results),
+        sum(errors for _, errors in results),
+        sum(registrations),
+        time.perf_counter() - start,
+    )
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+    baseline = None
+    for readers in (1, 2, 4, 8, 16):
+        result = stress(readers, seconds, writer=False)
+        baseline = baseline or result.throughput
+        print(
+            f"{readers:>2} readers: {result.throughput:>12,.0f} objects/s, "
+            f"scaling {result.throughput / baseline:.2f}"
+        )
+    for readers in (1, 4, 16):
+        result = stress(readers, seconds)
+        print(
+            f"{readers:>2} readers + writer: {result.throughput:>12,.0f} objects/s, "
+            f"{result.registrations / result.seconds:,.0f} registrations/s, "
+            f"{result.errors} wrong resources"
+        )
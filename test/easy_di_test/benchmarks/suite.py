@@ -0,0 +1,269 @@
+"""
+Benchmark suite of the library, with machine-readable results and regression gating.
+
+    python -m easy_di_test.benchmarks.suite run -o results.json
+    python -m easy_di_test.benchmarks.suite compare baseline.json results.json
+
+Run from the `test` directory, with the sources in the path. Every figure is lower-is-better; `compare` exits with 1
+if some figure is more than `--threshold` times its baseline. The baseline must come from the same machine.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import tracemalloc
+from timeit import Timer
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from easy_di_test.benchmarks import import_bench
+
+from easy_di import DI, di_init, injected
+from easy_di.injection import DiClassInjector
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 1.2
+FIELD_COUNTS = (1, 5, 20)
+INHERITANCE_DEPTHS = (1, 3, 6)
+
+
+class Result(NamedTuple):
+    value: float
+    unit: str
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[float]
+    value: Optional[float]
+    unit: str
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline or self.value is None:
+            return None
+        return self.value / self.baseline
+
+
+def _resource(kind: str, index: int) -> str:
+    return f"suite_{kind}_{index}"
+
+
+def _register_resources():
+    for index in range(max(FIELD_COUNTS)):
+        DI.register(_resource("value", index), object(), force=True)
+        DI.register(_resource("factory", index), object, force=True, is_factory=True)
+
+
+def _injected_class(name: str, resource_names: List[str], base: type = object):
+    """An injected class, built like the import hook would, with a field per resource"""
+    annotations = {
+        f"{name.lower()}_{index}": injected(object, resource_name)
+        for index, resource_name in enumerate(resource_names)
+    }
+    class_ = type(
+        name, (base,), {"__annotations__": annotations, "__module__": __name__}
+    )
+    DiClassInjector().inject(class_)
+    return class_
+
+
+def _plain_class(fields: int):
+    """The hand written equivalent of an injected class with values only"""
+    values = [object() for _ in range(fields)]
+    names = [f"field_{index}" for index in range(fields)]
+    source = "def __init__(self):\n" + "".join(
+        f"    self.{name} = _values[{index}]\n" for index, name in enumerate(names)
+    )
+    namespace = {"_values": values}
+    exec(source, namespace)  # nosec pylint: disable=exec-used
+    return type(f"Plain{fields}", (), {"__init__": namespace["__init__"]})
+
+
+def _time_per_call(function: Callable, runs: int) -> Result:
+    """Best time of a call, in nanoseconds"""
+    timer = Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=runs, number=number))
+    return Result(best / number * 1e9, "ns")
+
+
+def _memory_per_instance(class_: type, instances: int) -> Result:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = [class_() for _ in range(instances)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return Result(allocated / instances, "bytes")
+
+
+def construction_benchmarks(runs: int) -> Dict[str, Result]:
+    _register_resources()
+    results = {}
+    for fields in FIELD_COUNTS:
+        values = _injected_class(
+            f"Values{fields}", [_resource("value", i) for i in range(fields)]
+        )
+        factories = _injected_class(
+            f"Factories{fields}", [_resource("factory", i) for i in range(fields)]
+        )
+        results[f"construct_plain_{fields}"] = _time_per_call(
+            _plain_class(fields), runs
+        )
+        results[f"construct_values_{fields}"] = _time_per_call(values, runs)
+        results[f"construct_factories_{fields}"] = _time_per_call(factories, runs)
+    for depth in INHERITANCE_DEPTHS:
+        class_ = object
+        for level in range(depth):
+            class_ = _injected_class(
+                f"Level{depth}x{level}", [_resource("value", level)], class_
+            )
+        results[f"construct_inheritance_{depth}"] = _time_per_call(class_, runs)
+    results["get_value"] = _time_per_call(lambda: DI.get(_resource("value", 0)), runs)
+    results["get_factory"] = _time_per_call(
+        lambda: DI.get(_resource("factory", 0)), runs
+    )
+    return results
+
+
+def memory_benchmarks(instances: int) -> Dict[str, Result]:
+    _register_resources()
+    values = _injected_class("MemoryValues", [_resource("value", i) for i in range(5)])
+    return {
+        "memory_plain_5": _memory_per_instance(_plain_class(5), instances),
+        "memory_values_5": _memory_per_instance(values, instances),
+    }
+
+
+def import_benchmarks(modules: int, runs: int) -> Dict[str, Result]:
+    results = {}
+    for postponed in (False, True):
+        suffix = "_postponed" if postponed else ""
+        with tempfile.TemporaryDirectory() as directory:
+            import_bench.write_modules(directory, modules, postponed=postponed)
+            vanilla = min(
+                import_bench.time_imports(directory, modules, "vanilla")
+                for _ in range(runs)
+            )
+            hooked = min(
+                import_bench.time_imports(directory, modules, "di") for _ in range(runs)
+            )
+            results[f"import_hook{suffix}"] = Result(
+                hooked * 1e6 / modules, "us/module"
+            )
+            results[f"import_hook_overhead{suffix}"] = Result(hooked / vanilla, "ratio")
+            if not postponed:
+                sweep = min(
+                    import_bench.time_sweep(directory, modules) for _ in range(runs)
+                )
+                results["di_init_sweep"] = Result(sweep * 1e6 / modules, "us/module")
+    return results
+
+
+def run(quick: bool = False) -> dict:
+    di_init()
+    runs = 3 if quick else 7
+    results = {}
+    results.update(construction_benchmarks(runs))
+    results.update(memory_benchmarks(1000 if quick else 10000))
+    results.update(import_benchmarks(200 if quick else 3000, 1 if quick else 3))
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": {
+            name: {"value": result.value, "unit": result.unit}
+            for name, result in sorted(results.items())
+        },
+    }
+
+
+def compare(baseline: dict, current: dict) -> List[Comparison]:
+    for results in (baseline, current):
+        if results.get("version") != RESULTS_VERSION:
+            raise ValueError(f"Unsupported results version: {results.get('version')}")
+    baseline_results = baseline["results"]
+    current_results = current["results"]
+    comparisons = []
+    for name in sorted(set(baseline_results) | set(current_results)):
+        old = baseline_results.get(name)
+        new = current_results.get(name)
+        comparisons.append(
+            Comparison(
+                name,
+                None if old is None else old["value"],
+                None if new is None else new["value"],
+                (new or old)["unit"],
+            )
+        )
+    return comparisons
+
+
+def regressions(
+    comparisons: List[Comparison], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    return [c for c in comparisons if c.ratio is not None and c.ratio > threshold]
+
+
+def _format(comparisons: List[Comparison], threshold: float) -> str:
+    lines = [f"{'benchmark':<36} {'baseline':>12} {'current':>12} {'ratio':>7}  unit"]
+    for comparison in comparisons:
+        baseline = "-" if comparison.baseline is None else f"{comparison.baseline:.3f}"
+        value = "-" if comparison.value is None else f"{comparison.value:.3f}"
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}"
+        flag = (
+            "  REGRESSION" if comparison in regressions([comparison], threshold) else ""
+        )
+        lines.append(
+            f"{comparison.name:<36} {baseline:>12} {value:>12} {ratio:>7}  {comparison.unit}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m easy_di_test.benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="file to write the results to")
+    run_parser.add_argument(
+        "--quick", action="store_true", help="fewer runs and smaller inputs"
+    )
+    compare_parser = commands.add_parser(
+        "compare", help="fail if some result regressed against the baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"highest accepted ratio to the baseline, {DEFAULT_THRESHOLD} by default",
+    )
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "run":
+        results = json.dumps(run(arguments.quick), indent=2)
+        if arguments.output:
+            with open(arguments.output, "w", encoding="utf-8") as output:
+                output.write(results)
+                output.write("\n")
+        else:
+            print(results)
+        return 0
+
+    with open(arguments.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(arguments.current, encoding="utf-8") as current_file:
+        current = json.load(current_file)
+    comparisons = compare(baseline, current)
+    print(_format(comparisons, arguments.threshold))
+    return 1 if regressions(comparisons, arguments.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,17 @@ from timeit import timeit
 from unittest import TestCase
 from unittest.mock import Mock
 
+from easy_di_test.benchmarks import import_bench
+from easy_di_test.benchmarks.import_time import interpreter_time
 from easy_di_test.benchmarks.resources import Trivial
 
 from easy_di import DI, di_storage
 from easy_di.exceptions import UndefinedResourceException
 
 ACCEPTABLE_OVERHEAD = 1.2
+ACCEPTABLE_IMPORT_OVERHEAD = 1.5
+# a new interpreter importing easy_di, against one doing nothing
+ACCEPTABLE_IMPORT_TIME_RATIO = 5.0
 
 
 class WithParameter:
@@ -15,12 +20,14 @@ class WithParameter:
         self.object_1 = object_1
 
 
+_entry_object_1 = di_storage.entry("object_1")
+
+
 class SameBehaviour:
     def __init__(self):
         try:
-            self.object_1 = di_storage.__object_1__
-            if di_storage.__object_1_is_factory__:
-                self.object_1 = self.object_1()
+            value, is_factory = _entry_object_1.binding
+            self.object_1 = value() if is_factory else value
         except AttributeError as e:
             raise UndefinedResourceException(
                 f"`{e.args[0]}` Needed by class {self.__class__.__name__}"
@@ -54,3 +61,16 @@ class TestAgainstSameBehaviour(TestCase):
         time_di = timeit(Trivial, number=100000)
         ratio = time_di / time_std
         self.assertLessEqual(ratio, ACCEPTABLE_OVERHEAD)
+
+
+class TestImportHookOverhead(TestCase):
+    def test_1000_modules(self):
+        time_vanilla, time_di = import_bench.measure(modules=1000, runs=3)
+        ratio = time_di / time_vanilla
+        self.assertLessEqual(ratio, ACCEPTABLE_IMPORT_OVERHEAD)
+
+
+class TestLibraryImportTime(TestCase):
+    def test_import_easy_di(self):
+        ratio = interpreter_time("import easy_di") / interpreter_time("pass")
+        self.assertLessEqual(ratio, ACCEPTABLE_IMPORT_TIME_RATIO)
@@ -0,0 +1,72 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, di_init
+from easy_di.exceptions import UndefinedResourceException
+
+from .resources import Object1
+
+
+class BulkInjectionTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.first = Object1()
+        self.second = Object1()
+        self.factory = Mock()
+        DI.register("bulk_first", self.first, force=True)
+        DI.register("bulk_second", self.second, force=True)
+        DI.register("bulk_factory", self.factory, force=True, is_factory=True)
+
+    def test_bundle(self):
+        from .resources_11 import Facade
+
+        self.assertEqual(
+            {
+                "first": self.first,
+                "second": self.second,
+                "third": self.first,
+            },
+            Facade.__init__.__di_bundle__,
+        )
+        self.assertIn("self.__dict__.update(_bundle)", Facade.__init__.__di_code__)
+
+    def test_injection(self):
+        from .resources_11 import Facade
+
+        testing = Facade(1)
+
+        self.assertEqual(1, testing.key)
+        self.assertIs(self.first, testing.first)
+        self.assertIs(self.second, testing.second)
+        self.assertIs(self.first, testing.third)
+        self.assertIs(self.factory.return_value, testing.factory)
+
+    def test_bundle_follows_registrations(self):
+        from .resources_11 import Facade
+
+        other = Object1()
+        DI.register("bulk_first", other, force=True)
+
+        testing = Facade(1)
+
+        self.assertIs(other, testing.first)
+        self.assertIs(other, testing.third)
+
+    def test_kind_change_leaves_bundle(self):
+        from .resources_11 import Facade
+
+        factory = Mock()
+        DI.register("bulk_second", factory, force=True, is_factory=True)
+
+        self.assertNotIn("second", Facade.__init__.__di_bundle__)
+        self.assertIs(factory.return_value, Facade(1).second)
+
+    def test_not_registered_resource(self):
+        from .resources_11 import FacadeMissing
+
+        self.assertEqual(["first"], list(FacadeMissing.__init__.__di_bundle__))
+        with self.assertRaises(UndefinedResourceException):
+            FacadeMissing()
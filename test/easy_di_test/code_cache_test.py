@@ -0,0 +1,84 @@
+import marshal
+import sys
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from easy_di import DI
+from easy_di.code_cache import FORMAT_VERSION, CodeCache
+from easy_di.injection import ConstructorWrapper, DiClassInjector, injected
+
+from .resources import Object1
+
+
+def _new_class():
+    class Cached:
+        value: injected(Object1, "cache_value")
+        lazy: injected(Object1, "cache_value", lazy=True)
+
+    return Cached
+
+
+class CodeCacheTest(TestCase):
+    def setUp(self) -> None:
+        DI.register("cache_value", Object1(), force=True)
+        self.directory = tempfile.TemporaryDirectory()
+        self.pycache_prefix = sys.pycache_prefix
+        self.dont_write_bytecode = sys.dont_write_bytecode
+        sys.pycache_prefix = self.directory.name
+        sys.dont_write_bytecode = False
+
+    def tearDown(self) -> None:
+        sys.pycache_prefix = self.pycache_prefix
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        ConstructorWrapper.code_cache = None
+        self.directory.cleanup()
+
+    def test_reused_across_instances(self):
+        ConstructorWrapper.code_cache = CodeCache()
+        first = _new_class()
+        DiClassInjector().inject(first)
+        ConstructorWrapper.code_cache.flush()
+
+        ConstructorWrapper.code_cache = CodeCache()
+        second = _new_class()
+        with patch.object(ConstructorWrapper, "_assemble_code") as assemble:
+            DiClassInjector().inject(second)
+        assemble.assert_not_called()
+
+        self.assertEqual(first.__init__.__di_code__, second.__init__.__di_code__)
+        self.assertIs(DI.get("cache_value"), second().value)
+        self.assertIs(DI.get("cache_value"), second().lazy)
+
+    def test_discarded_when_source_changes(self):
+        ConstructorWrapper.code_cache = CodeCache()
+        DiClassInjector().inject(_new_class())
+        ConstructorWrapper.code_cache.flush()
+
+        testing = CodeCache()
+        with patch("os.stat") as stat:
+            stat.return_value.st_mtime_ns = 1
+            stat.return_value.st_size = 2
+            self.assertEqual({}, testing._module_cache(__name__).entries)
+
+    def test_not_written_without_bytecode(self):
+        testing = CodeCache()
+        ConstructorWrapper.code_cache = testing
+        DiClassInjector().inject(_new_class())
+
+        sys.dont_write_bytecode = True
+        testing.flush()
+
+        self.assertEqual({}, CodeCache()._module_cache(__name__).entries)
+
+    def test_discarded_when_malformed(self):
+        ConstructorWrapper.code_cache = CodeCache()
+        DiClassInjector().inject(_new_class())
+        ConstructorWrapper.code_cache.flush()
+        module_cache = ConstructorWrapper.code_cache._module_cache(__name__)
+        with open(module_cache.path, "wb") as cache_file:
+            marshal.dump(
+                (1, module_cache.source_stamp, {"key": "not code"}), cache_file
+            )
+
+        self.assertEqual({}, CodeCache()._module_cache(__name__).entries)
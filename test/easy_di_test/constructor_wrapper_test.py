@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock
 
+from easy_di import di_storage
 from easy_di.injection import ConstructorWrapper, DiClassInjector, InjectionWrapper
 
 
@@ -14,9 +15,8 @@ class ConstructorWrapperTestCase(unittest.TestCase):
         self.assertEqual(
             """def injected_constructor(self, *params, **kwargs):
     try:
-        self.a = di_storage.__a__
-        if di_storage.__a_is_factory__:
-           self.a = self.a()
+        _value, _is_factory = _entry_a.binding
+        self.a = _value() if _is_factory else _value
     except AttributeError as e:
         raise UndefinedResourceException(
               f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
@@ -35,12 +35,10 @@ class ConstructorWrapperTestCase(unittest.TestCase):
         self.assertEqual(
             """def injected_constructor(self, *params, **kwargs):
     try:
-        self.a = di_storage.__a__
-        if di_storage.__a_is_factory__:
-           self.a = self.a()
-        self.b = di_storage.__the_b__
-        if di_storage.__the_b_is_factory__:
-           self.b = self.b()
+        _value, _is_factory = _entry_a.binding
+        self.a = _value() if _is_factory else _value
+        _value, _is_factory = _entry_b.binding
+        self.b = _value() if _is_factory else _value
     except AttributeError as e:
         raise UndefinedResourceException(
               f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
@@ -60,16 +58,90 @@ class ConstructorWrapperTestCase(unittest.TestCase):
         self.assertEqual(
             """def injected_constructor(self, *params, **kwargs):
     try:
-        self.a = di_storage.__a__
-        if di_storage.__a_is_factory__:
-           self.a = self.a()
-        self.b = di_storage.__the_b__
-        if di_storage.__the_b_is_factory__:
-           self.b = self.b()
+        _value, _is_factory = _entry_a.binding
+        self.a = _value() if _is_factory else _value
+        _value, _is_factory = _entry_b.binding
+        self.b = _value() if _is_factory else _value
     except AttributeError as e:
         raise UndefinedResourceException(
               f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
     super(class_, self).__init__(*params, **kwargs)
+""",
+            code,
+        )
+
+    def test_assemble_lazy_getter(self):
+        testing = ConstructorWrapper()
+
+        code = testing._assemble_lazy_getter_code("a", InjectionWrapper(str, "the_a"))
+        self.assertEqual(
+            """def lazy_getter(self):
+    try:
+        value, is_factory = _entry_a.binding
+        if is_factory:
+           value = value()
+    except AttributeError as e:
+        raise UndefinedResourceException(
+              f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
+    self.a = value
+    return value
+""",
+            code,
+        )
+
+    def test_assemble_frozen_code(self):
+        requirements = {
+            "a": InjectionWrapper(str, "frozen_a"),
+            "b": InjectionWrapper(str, "frozen_b"),
+            "c": InjectionWrapper(str, "frozen_c", force_no_factory=True),
+            "d": InjectionWrapper(str, "frozen_missing"),
+        }
+        di_storage.store("frozen_a", "A", False)
+        di_storage.store("frozen_b", Mock(), True)
+        di_storage.store("frozen_c", Mock(), True)
+        testing = ConstructorWrapper()
+        bindings = {}
+
+        code = testing._assemble_frozen_code(
+            requirements, DiClassInjector.call_parent, bindings
+        )
+        self.assertEqual(
+            """def make_injected_constructor(_di_a, _di_b, _di_c, _di_d):
+    def injected_constructor(self, *params, **kwargs):
+        self.a = _di_a
+        self.b = _di_b()
+        self.c = _di_c
+        raise UndefinedResourceException(
+              f'`{_di_d}` Needed by class {self.__class__.__name__}')
+        super(class_, self).__init__(*params, **kwargs)
+    return injected_constructor
+""",
+            code,
+        )
+        self.assertEqual({"_di_a", "_di_b", "_di_c", "_di_d"}, set(bindings))
+        self.assertEqual("frozen_missing", bindings["_di_d"])
+
+    def test_assemble_specialised_code(self):
+        requirements = {
+            "a": InjectionWrapper(str, None),
+            "b": InjectionWrapper(str, "the_b"),
+            "c": InjectionWrapper(str, None),
+        }
+        testing = ConstructorWrapper()
+
+        code = testing._assemble_code(
+            requirements, object.__init__, {"a": False, "the_b": True, "c": None}
+        )
+        self.assertEqual(
+            """def injected_constructor(self, *params, **kwargs):
+    try:
+        self.a = _entry_a.instance
+        self.b = _entry_b.factory()
+        _value, _is_factory = _entry_c.binding
+        self.c = _value() if _is_factory else _value
+    except AttributeError as e:
+        raise UndefinedResourceException(
+              f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
 """,
             code,
         )
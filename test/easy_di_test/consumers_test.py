@@ -0,0 +1,99 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from easy_di import DI, di_init
+from easy_di.injection import ConstructorWrapper, DiClassInjector, injected
+
+from .resources import Object1
+
+
+class ConsumersIndexTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.db = Object1()
+        DI.register("index_db", self.db, force=True)
+        DI.register("index_other", Object1(), force=True)
+
+    def test_consumers(self):
+        from .resources_9 import DbConsumer, LazyDbConsumer, NotConsumer
+
+        self.assertEqual(
+            {DbConsumer: ["db"], LazyDbConsumer: ["connection"]},
+            DI.consumers("index_db"),
+        )
+        self.assertEqual(
+            {DbConsumer: ["other"], NotConsumer: ["other"]},
+            DI.consumers("index_other"),
+        )
+        self.assertEqual({}, DI.consumers("index_unknown"))
+
+    def test_specialised_on_registered_kind(self):
+        from .resources_9 import DbConsumer
+
+        self.assertIn("_entry_db.instance", DbConsumer.__init__.__di_code__)
+        self.assertIs(self.db, DbConsumer().db)
+
+    def test_only_affected_constructors_rebuilt(self):
+        from .resources_9 import DbConsumer, NotConsumer
+
+        not_affected = NotConsumer.__init__
+        factory = Mock()
+
+        DI.register("index_db", factory, force=True, is_factory=True)
+
+        self.assertIs(not_affected, NotConsumer.__init__)
+        self.assertIn("_entry_db.factory()", DbConsumer.__init__.__di_code__)
+        self.assertIs(factory.return_value, DbConsumer().db)
+
+    def test_same_kind_not_rebuilt(self):
+        from .resources_9 import DbConsumer
+
+        constructor = DbConsumer.__init__
+
+        DI.register("index_db", Object1(), force=True)
+
+        self.assertIs(constructor, DbConsumer.__init__)
+
+    def test_materialized_singleton_takes_value_path(self):
+        from .resources_9 import DbConsumer
+
+        DI.register(
+            "index_db", Mock(side_effect=Object1), force=True, lifetime="singleton"
+        )
+        self.assertIn("_entry_db.factory()", DbConsumer.__init__.__di_code__)
+
+        singleton = DbConsumer().db
+
+        self.assertNotIn("_entry_db.factory()", DbConsumer.__init__.__di_code__)
+        self.assertIs(singleton, DbConsumer().db)
+
+    def test_specialised_on_first_construction(self):
+        class Late:
+            first: injected(Object1, "index_late_first")
+            second: injected(Object1, "index_late_second")
+
+        DiClassInjector().inject(Late)
+        generic_code = Late.__init__.__di_code__
+        value = Object1()
+        with patch.object(
+            ConstructorWrapper,
+            "_build_constructor",
+            autospec=True,
+            side_effect=ConstructorWrapper._build_constructor,
+        ) as build:
+            DI.register("index_late_first", value)
+            DI.register("index_late_second", Object1, is_factory=True)
+
+            self.assertEqual(generic_code, Late.__init__.__di_code__)
+            build.assert_not_called()
+
+            testing, _ = Late(), Late()
+
+        build.assert_called_once()
+        self.assertIn("_entry_first.instance", Late.__init__.__di_code__)
+        self.assertIn("_entry_second.factory()", Late.__init__.__di_code__)
+        self.assertIs(value, testing.first)
+        self.assertIsInstance(testing.second, Object1)
@@ -0,0 +1,172 @@
+import asyncio
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from easy_di import DI, di_init, di_storage
+from easy_di.exceptions import (
+    DuplicateResourceException,
+    FrozenRegistryException,
+    UndefinedResourceException,
+)
+from easy_di.injection import DiClassInjector
+
+from .resources import Object1
+
+
+class ContextScopeTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.session = Object1()
+        self.tenant = Object1()
+        self.config = Object1()
+        DI.register("scoped_session", self.session, force=True)
+        DI.register("scoped_tenant", self.tenant, force=True)
+        DI.register("scoped_config", self.config, force=True)
+        DI.register("unscoped_value", Object1(), force=True)
+
+    def test_override(self):
+        from .resources_19 import RequestHandler
+
+        session, tenant, config = Object1(), Object1(), Object1()
+        with DI.scope():
+            DI.register("scoped_session", session)
+            DI.register("scoped_tenant", lambda: tenant, is_factory=True)
+            DI.register("scoped_config", config)
+            testing = RequestHandler()
+
+            self.assertIs(session, testing.session)
+            self.assertIs(tenant, testing.tenant)
+            self.assertIs(config, testing.config)
+            self.assertIs(session, DI.get("scoped_session"))
+
+        testing = RequestHandler()
+        self.assertIs(self.session, testing.session)
+        self.assertIs(self.tenant, testing.tenant)
+        self.assertIs(self.config, testing.config)
+
+    def test_nested(self):
+        outer, inner = Object1(), Object1()
+        with DI.scope():
+            DI.register("scoped_session", outer)
+            with DI.scope():
+                self.assertIs(outer, DI.get("scoped_session"))
+                DI.register("scoped_session", inner)
+                self.assertIs(inner, DI.get("scoped_session"))
+            self.assertIs(outer, DI.get("scoped_session"))
+
+    def test_only_in_scope(self):
+        with DI.scope():
+            DI.register("scoped_only", self.session)
+            self.assertTrue(DI.exists("scoped_only"))
+            self.assertIs(self.session, DI.get("scoped_only"))
+
+        self.assertFalse(DI.exists("scoped_only"))
+        with self.assertRaises(UndefinedResourceException):
+            DI.get("scoped_only")
+
+    def test_duplicate_in_same_scope(self):
+        with DI.scope():
+            DI.register("scoped_session", Object1())
+            with self.assertRaises(DuplicateResourceException):
+                DI.register("scoped_session", Object1())
+
+    def test_frozen(self):
+        DI.freeze()
+        try:
+            with DI.scope(), self.assertRaises(FrozenRegistryException):
+                DI.register("scoped_session", Object1())
+        finally:
+            DI.unfreeze()
+
+    def test_fast_path_until_scoped(self):
+        from .resources_19 import RequestHandler, Unscoped
+
+        with DI.scope():
+            DI.register("scoped_session", Object1())
+
+        self.assertIs(di_storage.Entry, type(di_storage.entry("unscoped_value")))
+        self.assertIs(di_storage.ScopedEntry, type(di_storage.entry("scoped_session")))
+        self.assertEqual({"unscoped_value": False}, Unscoped.__init__.__di_kinds__)
+        self.assertIsNone(RequestHandler.__init__.__di_kinds__["scoped_session"])
+
+    def test_singleton_built_in_scope(self):
+        with DI.scope():
+            DI.register("scoped_session", Object1, lifetime="singleton")
+            built = DI.get("scoped_session")
+            self.assertIs(built, DI.get("scoped_session"))
+
+        self.assertIs(self.session, DI.get("scoped_session"))
+
+    def test_threads(self):
+        barrier = threading.Barrier(4)
+        seen = {}
+
+        def request(index):
+            with DI.scope():
+                DI.register("scoped_session", index)
+                barrier.wait()
+                seen[index] = DI.get("scoped_session")
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({i: i for i in range(4)}, seen)
+
+    def test_tasks(self):
+        from .resources_19 import RequestHandler
+
+        async def request(index):
+            with DI.scope():
+                DI.register("scoped_session", index)
+                await asyncio.sleep(0)
+                return RequestHandler().session
+
+        async def serve():
+            return await asyncio.gather(*(request(i) for i in range(4)))
+
+        self.assertEqual([0, 1, 2, 3], asyncio.run(serve()))
+
+    def test_concurrent_first_scoped_registrations(self):
+        from .resources_19 import ConcurrentlyScoped
+
+        DI.register("scoped_race_db", Object1(), force=True)
+        index = DiClassInjector.consumers_index
+        resource_changed = index.resource_changed
+        rebuilding, release = threading.Event(), threading.Event()
+
+        def slow_resource_changed(resource_name):
+            rebuilding.set()
+            release.wait(5)
+            resource_changed(resource_name)
+
+        mine, built = Object1(), []
+
+        def first():
+            with DI.scope():
+                DI.register("scoped_race_db", Object1())
+
+        def second():
+            rebuilding.wait(5)
+            with DI.scope():
+                DI.register("scoped_race_db", mine)
+                built.append(ConcurrentlyScoped().db)
+
+        with patch.object(index, "resource_changed", slow_resource_changed):
+            threads = [threading.Thread(target=first), threading.Thread(target=second)]
+            for thread in threads:
+                thread.start()
+            rebuilding.wait(5)
+            # the second registration must wait for the rebuild
+            threads[1].join(0.05)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual([mine], built)
@@ -0,0 +1,59 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, di_init
+
+from .resources import Object1, Object3
+
+
+class FlattenTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.factory = Mock()
+        self.object = Object1()
+        self.other = Object3()
+        DI.register("flat_factory", self.factory, force=True, is_factory=True)
+        DI.register("flat_object", self.object, force=True)
+        DI.register("flat_other", self.other, force=True)
+
+    def test_parents_merged_up_to_user_constructor(self):
+        from .resources_10 import FlatChild, FlatGrandChild, FlatGrandGrandChild
+
+        constructor = FlatGrandGrandChild.__init__
+        self.assertEqual(["d", "b", "c"], list(constructor.__di_requirements__))
+        self.assertIs(FlatChild.__init__.__di_wrapped__, constructor.__di_wrapped__)
+        self.assertNotIn("super(", constructor.__di_code__)
+        self.assertEqual(["c", "b"], list(FlatGrandChild.__init__.__di_requirements__))
+
+    def test_injection(self):
+        from .resources_10 import FlatChild, FlatGrandGrandChild
+
+        FlatChild.calls = 0
+
+        testing = FlatGrandGrandChild(1)
+
+        self.assertEqual(1, testing.k)
+        self.assertEqual(1, FlatChild.calls)
+        self.assertIs(self.factory.return_value, testing.a)
+        self.assertIs(self.other, testing.b)
+        self.assertIs(self.object, testing.c)
+        self.assertIs(self.factory.return_value, testing.d)
+        self.assertEqual(2, self.factory.call_count)
+
+    def test_consumers_include_merged_fields(self):
+        from .resources_10 import FlatGrandGrandChild
+
+        self.assertEqual(["c"], DI.consumers("flat_object")[FlatGrandGrandChild])
+
+    def test_multiple_inheritance_not_flattened(self):
+        from .resources_10 import NotFlattened
+
+        testing = NotFlattened(2)
+
+        self.assertEqual(["f"], list(NotFlattened.__init__.__di_requirements__))
+        self.assertIs(self.object, testing.f)
+        self.assertIs(self.object, testing.c)
+        self.assertEqual(2, testing.k)
@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, di_init
+from easy_di.exceptions import FrozenRegistryException, UndefinedResourceException
+
+from .resources import Object1
+
+
+class FreezeTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+        from .resources_8 import FrozenChild, FrozenMissing, ToBeFrozen
+
+        cls.classes = ToBeFrozen, FrozenChild, FrozenMissing
+
+    def setUp(self) -> None:
+        self.value = Object1()
+        self.factory = Mock()
+        DI.register("frozen_value", self.value, force=True)
+        DI.register("frozen_factory", self.factory, force=True, is_factory=True)
+        DI.freeze()
+
+    def tearDown(self) -> None:
+        DI.unfreeze()
+
+    def test_frozen_constructor(self):
+        from .resources_8 import ToBeFrozen
+
+        testing = ToBeFrozen(1)
+
+        self.assertEqual(1, testing.key)
+        self.assertIs(self.value, testing.value)
+        self.assertIs(self.factory.return_value, testing.factory)
+        self.assertNotIn("_entry_", ToBeFrozen.__init__.__di_code__)
+        self.assertIsNotNone(ToBeFrozen.__init__.__closure__)
+
+    def test_frozen_child(self):
+        from .resources_8 import FrozenChild
+
+        testing = FrozenChild(2)
+
+        self.assertEqual(2, testing.key)
+        self.assertIs(self.value, testing.other)
+        self.assertIs(self.factory.return_value, testing.factory)
+
+    def test_frozen_missing_resource(self):
+        from .resources_8 import FrozenMissing
+
+        with self.assertRaises(UndefinedResourceException):
+            FrozenMissing()
+
+    def test_frozen_missing_resource_name_not_evaluated(self):
+        from .resources_8 import FrozenOddName
+
+        with self.assertRaises(UndefinedResourceException) as raised:
+            FrozenOddName()
+        self.assertIn("`frozen_{1 + 1}_'never'_registered`", str(raised.exception))
+
+    def test_register_rejected(self):
+        self.assertTrue(DI.is_frozen())
+        with self.assertRaises(FrozenRegistryException):
+            DI.register("frozen_value", Object1(), force=True)
+
+    def test_unfreeze(self):
+        DI.unfreeze()
+
+        self.assertFalse(DI.is_frozen())
+        for class_ in self.classes:
+            self.assertFalse(getattr(class_.__init__, "__di_frozen__", False))
+            self.assertIn("_entry_", class_.__init__.__di_code__)
+        other = Object1()
+        DI.register("frozen_value", other, force=True)
+        from .resources_8 import ToBeFrozen
+
+        self.assertIs(other, ToBeFrozen(1).value)
+
+    def test_frozen_in_scope_binds_global_resources(self):
+        DI.unfreeze()
+        with DI.scope():
+            DI.register("frozen_value", Object1())
+            DI.freeze()
+        from .resources_8 import ToBeFrozen
+
+        self.assertIs(self.value, ToBeFrozen(1).value)
@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from easy_di_test.benchmarks.import_time import import_times
+
+# Modules `import easy_di` must not load: they are imported when the feature needing them is used
+LAZY_MODULES = {
+    "asyncio",
+    "ast",
+    "easy_di.code_cache",
+    "easy_di.manifest",
+    "easy_di.profiling",
+    "importlib.abc",
+    "json",
+    "unittest",
+    "unittest.mock",
+}
+
+
+class ImportTimeTest(TestCase):
+    def test_heavy_modules_not_imported(self):
+        times = import_times()
+
+        self.assertIn("easy_di", times)
+        self.assertEqual(set(), LAZY_MODULES & set(times) - set(import_times("pass")))
+
+    def test_lazy_modules_still_available(self):
+        times = import_times(
+            "from easy_di import DI; DI.register_mock('x').assert_not_called()"
+        )
+
+        self.assertIn("unittest.mock", times)
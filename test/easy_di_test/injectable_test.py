@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from easy_di import DI, Injectable, injected
+from easy_di.injection import DiClassInjector, DiModuleInjector
+
+from . import resources_17
+from .resources import Object1
+
+
+class InjectableTest(TestCase):
+    def setUp(self) -> None:
+        self.value = Object1()
+        DI.register("injectable_value", self.value, force=True)
+
+    def test_injected_at_creation(self):
+        class Local(Injectable):
+            value: injected(Object1, "injectable_value")
+
+        self.assertIs(self.value, Local().value)
+        self.assertIn(Local, DiClassInjector.injected_classes)
+
+    def test_subclasses(self):
+        testing = resources_17.ChildService(1)
+
+        self.assertIs(self.value, testing.value)
+        self.assertIs(self.value, testing.other)
+        self.assertEqual(1, testing.k)
+        self.assertIs(self.value, resources_17.SlottedService().value)
+
+    def test_skipped_by_module_injector(self):
+        with patch.object(DiClassInjector, "inject") as inject:
+            DiModuleInjector().inject(resources_17)
+
+        inject.assert_not_called()
+
+    def test_without_import_hook(self):
+        env = dict(
+            os.environ, PYTHONPATH=os.pathsep.join(sys.path), EASY_DI_IMPORT_HOOK="0"
+        )
+        statement = (
+            "import sys\n"
+            "from easy_di import DI\n"
+            "from easy_di.loaders_patching import InjectionFinder\n"
+            "from easy_di_test.resources_17 import Service\n"
+            "assert not any(isinstance(f, InjectionFinder) for f in sys.meta_path)\n"
+            "DI.register('injectable_value', 1)\n"
+            "assert Service().value == 1\n"
+        )
+
+        subprocess.run([sys.executable, "-c", statement], env=env, check=True)
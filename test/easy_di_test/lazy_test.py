@@ -0,0 +1,70 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, di_init
+from easy_di.exceptions import UndefinedResourceException
+from easy_di.injection import LazyInjection
+
+from .resources import Object1
+
+
+class LazyInjectionTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+        cls.lazy_object = Object1()
+        cls.lazy_factory = Mock()
+        DI.register("lazy_object", cls.lazy_object, force=True)
+        DI.register("lazy_factory", cls.lazy_factory, force=True, is_factory=True)
+
+    def setUp(self) -> None:
+        self.lazy_factory.reset_mock()
+
+    def test_lazy_field_resolved_on_first_access(self):
+        from .resources_6 import LazyFields
+
+        testing = LazyFields(1)
+
+        self.assertEqual(1, testing.key)
+        self.assertIs(self.lazy_object, testing.__dict__["eager"])
+        self.assertNotIn("lazy", testing.__dict__)
+        self.assertNotIn("lazy_factory", testing.__dict__)
+        self.lazy_factory.assert_not_called()
+
+        self.assertIs(self.lazy_object, testing.lazy)
+        self.assertIs(self.lazy_factory.return_value, testing.lazy_factory)
+        self.assertIs(self.lazy_factory.return_value, testing.lazy_factory)
+        self.lazy_factory.assert_called_once_with()
+        self.assertIs(self.lazy_object, testing.__dict__["lazy"])
+
+    def test_descriptor_installed_on_class(self):
+        from .resources_6 import LazyFields
+
+        self.assertIsInstance(LazyFields.lazy, LazyInjection)
+        self.assertIsNotNone(LazyFields.lazy.getter.__di_code__)
+
+    def test_class_default(self):
+        from .resources_6 import LazyByDefault
+
+        testing = LazyByDefault()
+
+        self.assertEqual({"forced_eager": self.lazy_object}, testing.__dict__)
+        self.assertIs(self.lazy_object, testing.first)
+        self.assertIs(self.lazy_factory.return_value, testing.second)
+
+    def test_inherited_lazy_fields(self):
+        from .resources_6 import LazyChild
+
+        testing = LazyChild(2)
+
+        self.assertEqual({"eager": self.lazy_object, "key": 2}, testing.__dict__)
+        self.assertIs(self.lazy_object, testing.other)
+        self.assertIs(self.lazy_object, testing.lazy)
+
+    def test_undefined_lazy_resource(self):
+        from .resources_6 import LazyUndefined
+
+        testing = LazyUndefined()
+
+        with self.assertRaises(UndefinedResourceException):
+            _ = testing.missing
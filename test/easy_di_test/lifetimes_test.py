@@ -0,0 +1,107 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, Lifetime, di_init, di_storage
+from easy_di.exceptions import DependencyCycleException
+
+from .resources import Object1
+
+
+class LifetimesTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.singleton_factory = Mock(side_effect=Object1)
+        self.thread_factory = Mock(side_effect=Object1)
+        self.transient_factory = Mock(side_effect=Object1)
+        DI.register(
+            "singleton_resource",
+            self.singleton_factory,
+            force=True,
+            lifetime=Lifetime.SINGLETON,
+        )
+        DI.register(
+            "thread_resource", self.thread_factory, force=True, lifetime="thread"
+        )
+        DI.register(
+            "transient_resource",
+            self.transient_factory,
+            force=True,
+            lifetime=Lifetime.TRANSIENT,
+        )
+
+    def test_singleton_built_once(self):
+        from .resources_7 import WithLifetimes
+
+        first, second = WithLifetimes(), WithLifetimes()
+
+        self.assertIs(first.singleton, second.singleton)
+        self.assertIs(first.singleton, DI.get("singleton_resource"))
+        self.singleton_factory.assert_called_once_with()
+
+    def test_singleton_takes_non_factory_path_once_built(self):
+        entry = di_storage.entry("singleton_resource")
+        self.assertTrue(entry.is_factory)
+
+        singleton = DI.get("singleton_resource")
+
+        self.assertFalse(entry.is_factory)
+        self.assertIs(singleton, entry.value)
+
+    def test_singleton_built_once_across_threads(self):
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(DI.get("singleton_resource"))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.singleton_factory.assert_called_once_with()
+
+    def test_singleton_needing_itself_raises(self):
+        DI.register(
+            "cyclic_resource",
+            lambda: DI.get("cyclic_resource"),
+            force=True,
+            lifetime=Lifetime.SINGLETON,
+        )
+
+        with self.assertRaises(DependencyCycleException):
+            DI.get("cyclic_resource")
+        # not built: the next resolution tries again
+        self.assertTrue(di_storage.entry("cyclic_resource").is_factory)
+
+    def test_thread_one_instance_per_thread(self):
+        from .resources_7 import WithLifetimes
+
+        main_thread = WithLifetimes().per_thread
+        other_thread = []
+        thread = threading.Thread(
+            target=lambda: other_thread.append(WithLifetimes().per_thread)
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIs(main_thread, WithLifetimes().per_thread)
+        self.assertIsNot(main_thread, other_thread[0])
+        self.assertEqual(2, self.thread_factory.call_count)
+
+    def test_transient_built_every_time(self):
+        from .resources_7 import WithLifetimes
+
+        self.assertIsNot(WithLifetimes().transient, WithLifetimes().transient)
+        self.assertEqual(2, self.transient_factory.call_count)
+
+    def test_invalid_lifetime(self):
+        with self.assertRaises(ValueError):
+            DI.register("invalid_lifetime", Mock(), lifetime="forever")
@@ -0,0 +1,47 @@
+import importlib.machinery
+import importlib.util
+import sys
+from unittest import TestCase
+
+from easy_di import di_init
+from easy_di.injection import DiModuleInjector, ModuleScope
+from easy_di.loaders_patching import InjectionFinder, install_finder
+
+
+class InjectionFinderTest(TestCase):
+    def setUp(self) -> None:
+        di_init()
+        self.scope = DiModuleInjector.scope
+
+    def tearDown(self) -> None:
+        DiModuleInjector.scope = self.scope
+
+    def test_installed_once_first(self):
+        finder = install_finder()
+
+        self.assertIs(finder, sys.meta_path[0])
+        self.assertEqual(1, sum(isinstance(f, InjectionFinder) for f in sys.meta_path))
+
+    def test_out_of_scope_not_wrapped(self):
+        DiModuleInjector.scope = ModuleScope(exclude=["json"])
+
+        self.assertIsNone(sys.meta_path[0].find_spec("json", None))
+        spec = importlib.util.find_spec("json")
+        self.assertNotIn("InjectionPatchLoader", type(spec.loader).__name__)
+
+    def test_in_scope_delegates(self):
+        path = sys.modules["easy_di_test"].__path__
+        spec = sys.meta_path[0].find_spec("easy_di_test.resources", path)
+        original_spec = importlib.machinery.PathFinder.find_spec(
+            "easy_di_test.resources", path
+        )
+
+        self.assertEqual(original_spec.origin, spec.origin)
+        self.assertEqual(
+            original_spec.loader.get_source("easy_di_test.resources"),
+            spec.loader.get_source("easy_di_test.resources"),
+        )
+        self.assertIs(spec.loader.loader.__class__, original_spec.loader.__class__)
+
+    def test_missing_module(self):
+        self.assertIsNone(sys.meta_path[0].find_spec("easy_di_test.missing", None))
@@ -0,0 +1,114 @@
+import ast
+import io
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from types import ModuleType
+from unittest import TestCase
+
+from easy_di.__main__ import main
+from easy_di.manifest import Manifest, ManifestScanner
+
+SOURCE = """
+from typing import Optional
+
+from easy_di import injected as inj
+import easy_di
+
+
+class Plain:
+    a: int
+
+
+class WithInjected:
+    a: inj(int)
+    b: easy_di.injected(str, "the_b")
+    c: "Optional[injected(str)]"
+    d: "str"
+
+    def method(self):
+        class Nested:
+            e: inj(int)
+
+
+if True:
+    class Conditional:
+        f: Optional[inj(int)]
+"""
+
+
+class ManifestScannerTest(TestCase):
+    def test_scan_module(self):
+        classes = ManifestScanner().scan_module(ast.parse(SOURCE))
+
+        self.assertEqual(
+            {"WithInjected": ["a", "b", "c"], "Conditional": ["f"]}, classes
+        )
+
+    def test_scan_package(self):
+        manifest = ManifestScanner().scan_package("easy_di_test")
+
+        self.assertEqual(
+            {"FakeInjectedClass": ["object_1", "object_2", "object_3"]},
+            manifest.modules["easy_di_test.resources"],
+        )
+        self.assertEqual(
+            ["object_1", "object_2", "object_3", "another", "the_name"],
+            manifest.modules["easy_di_test.resources_2"]["OtherFakeInjectedClass"],
+        )
+        self.assertIn("easy_di_test.benchmarks.resources", manifest)
+        self.assertNotIn("easy_di_test.di_test", manifest)
+
+
+class ManifestTest(TestCase):
+    def setUp(self) -> None:
+        self.manifest = Manifest({"my_app.models": {"Model": ["db"]}})
+
+    def test_scope(self):
+        module = ModuleType("my_app.models")
+        module.Model = type("Model", (), {})
+        module.Other = type("Other", (), {})
+
+        self.assertIn("my_app.models", self.manifest)
+        self.assertNotIn("my_app", self.manifest)
+        self.assertEqual([module.Model], self.manifest.candidates(module))
+
+    def test_json(self):
+        self.assertEqual(self.manifest, Manifest.from_json(self.manifest.to_json()))
+
+    def test_diff(self):
+        other = Manifest(
+            {"my_app.models": {"Model": ["db", "cache"]}, "my_app.views": {"V": ["db"]}}
+        )
+
+        self.assertEqual(
+            [
+                "my_app.models.Model: ['db'] != ['db', 'cache']",
+                "my_app.views.V: None != ['db']",
+            ],
+            self.manifest.diff(other),
+        )
+
+
+class CommandLineTest(TestCase):
+    def test_write_and_check(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+
+            self.assertEqual(0, main(["manifest", "easy_di_test", "-o", path]))
+            self.assertEqual(0, main(["manifest", "easy_di_test", "--check", path]))
+
+            with open(path, "w", encoding="utf-8") as manifest_file:
+                manifest_file.write(Manifest({}).to_json())
+            with redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(1, main(["manifest", "easy_di_test", "--check", path]))
+            self.assertIn("easy_di_test.resources.FakeInjectedClass", errors.getvalue())
+
+    def test_stdout(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(0, main(["manifest", "easy_di_test"]))
+
+        self.assertEqual(
+            ManifestScanner().scan_package("easy_di_test"),
+            Manifest.from_json(output.getvalue()),
+        )
@@ -0,0 +1,78 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from easy_di import DI, di_init
+from easy_di.injection import (
+    InjectionWrapper,
+    LazyInjection,
+    SharedInjection,
+    StringAnnotationResolver,
+)
+
+from . import resources_16
+from .resources import Object1
+
+
+class PostponedAnnotationsTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.value = Object1()
+        self.list = [Object1()]
+        DI.register("postponed_value", self.value, force=True)
+        DI.register("postponed_list", self.list, force=True)
+
+    def test_injected(self):
+        from .resources_16 import Postponed
+
+        testing = Postponed()
+
+        self.assertIs(self.value, testing.dotted)
+        self.assertIs(self.list, testing.generic)
+        self.assertIs(self.value, testing.optional)
+        self.assertIs(self.value, testing.lazy)
+        self.assertIs(self.value, testing.shared)
+        self.assertIs(self.value, testing.only_checked)
+        self.assertFalse(hasattr(testing, "not_injected"))
+        self.assertIsInstance(Postponed.__dict__["lazy"], LazyInjection)
+        self.assertIsInstance(Postponed.__dict__["shared"], SharedInjection)
+
+
+class StringAnnotationResolverTest(TestCase):
+    def test_arguments(self):
+        testing = StringAnnotationResolver()
+
+        reference = testing.resolve(
+            resources_16, "Optional[dependency(List[Object1], name='x', lazy=True)]"
+        )
+
+        self.assertIsInstance(reference, InjectionWrapper)
+        self.assertEqual(
+            "typing.List[easy_di_test.resources.Object1]", str(reference.class_)
+        )
+        self.assertEqual("x", reference.name)
+        self.assertTrue(reference.lazy)
+
+    def test_unresolved_type_kept_as_string(self):
+        reference = StringAnnotationResolver().resolve(
+            resources_16, "injected(Object2, 'x')"
+        )
+
+        self.assertEqual("Object2", reference.class_)
+
+    def test_memoized_per_module(self):
+        testing = StringAnnotationResolver()
+
+        first = testing.resolve(resources_16, "dependency(Object1)")
+        self.assertIs(first, testing.resolve(resources_16, "dependency(Object1)"))
+        self.assertIsNone(testing.resolve(resources_16, "dependency_list"))
+
+    def test_skips_annotations_without_injected(self):
+        testing = StringAnnotationResolver()
+
+        with patch.object(StringAnnotationResolver, "_parse") as parse:
+            self.assertIsNone(testing.resolve(resources_16, "List[Object1]"))
+            self.assertIsNone(testing.resolve(resources_16, "int"))
+        parse.assert_not_called()
@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from easy_di import DI, di_init
+from easy_di.exceptions import UndefinedResourceException
+from easy_di.registrations import Registration, RegistrationSpec
+
+from .resources_21 import PROCESS_SETTING, Connection, connection_pid
+
+
+def _in_child(function):
+    """Runs the function in a forked process, returns its result"""
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        with os.fdopen(write, "wb") as pipe:
+            pickle.dump(function(), pipe)
+        os._exit(0)
+    os.close(write)
+    with os.fdopen(read, "rb") as pipe:
+        result = pickle.load(pipe)
+    os.waitpid(pid, 0)
+    return result
+
+
+class ProcessesTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_reset_after_fork(self):
+        DI.register(
+            "process_connection",
+            Connection,
+            force=True,
+            lifetime="singleton",
+            reset_after_fork=True,
+        )
+        connection_pid()
+
+        registry_pid, injected_pid, child_pid = _in_child(connection_pid)
+
+        self.assertEqual(child_pid, registry_pid)
+        self.assertEqual(child_pid, injected_pid)
+        self.assertEqual(os.getpid(), connection_pid()[0])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_reset_after_fork_needs_factory(self):
+        with self.assertRaises(ValueError):
+            DI.register(
+                "process_value", Connection(), force=True, reset_after_fork=True
+            )
+
+        self.assertFalse(DI.exists("process_value"))
+
+    def test_inherited_without_reset(self):
+        DI.register("process_connection", Connection, force=True, lifetime="singleton")
+        connection_pid()
+
+        registry_pid, _, child_pid = _in_child(connection_pid)
+
+        self.assertEqual(os.getpid(), registry_pid)
+        self.assertNotEqual(child_pid, registry_pid)
+
+    def test_export(self):
+        DI.register("process_connection", Connection, force=True, lifetime="singleton")
+        DI.register("process_setting", PROCESS_SETTING, force=True)
+        connection_pid()
+
+        spec = DI.export_spec("process_connection", "process_setting")
+
+        self.assertEqual(
+            RegistrationSpec(
+                [
+                    Registration(
+                        "process_connection", Connection, lifetime="singleton"
+                    ),
+                    Registration("process_setting", PROCESS_SETTING),
+                ]
+            ),
+            pickle.loads(pickle.dumps(spec)),
+        )
+        with self.assertRaises(UndefinedResourceException):
+            DI.export_spec("process_never_registered")
+
+    def test_apply(self):
+        DI.register("process_connection", Connection, force=True, lifetime="singleton")
+        spec = DI.export_spec("process_connection")
+        DI.register("process_connection", "replaced", force=True)
+
+        DI.apply_spec(spec)
+
+        self.assertIsInstance(DI.get("process_connection"), Connection)
+
+    def test_spawned_workers(self):
+        DI.register("process_connection", Connection, force=True, lifetime="singleton")
+        spec = DI.export_spec("process_connection")
+
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=DI.apply_spec,
+            initargs=(spec,),
+        ) as executor:
+            registry_pid, injected_pid, worker_pid = executor.submit(
+                connection_pid
+            ).result()
+
+        self.assertEqual(worker_pid, registry_pid)
+        self.assertEqual(worker_pid, injected_pid)
+        self.assertNotEqual(os.getpid(), worker_pid)
@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+from unittest import TestCase
+
+from easy_di.profiling import StartupProfile
+
+PROFILED_MODULE = "easy_di_test.resources_24"
+
+
+def run_profiled(statement: str, cwd: Optional[str] = None, **env) -> str:
+    """Runs the statement in a new interpreter, returns its stderr"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), **env)
+    result = subprocess.run(
+        [sys.executable, "-c", statement],
+        cwd=cwd,
+        env=env,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return result.stderr
+
+
+class ProfilingTest(TestCase):
+    def test_environment_variable_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            run_profiled(
+                f"import easy_di; import {PROFILED_MODULE}", EASY_DI_PROFILE=path
+            )
+            with open(path, encoding="utf-8") as profile_file:
+                profile = json.load(profile_file)
+
+        module = profile["modules"][PROFILED_MODULE]
+        self.assertEqual(3, module["classes_inspected"])
+        self.assertEqual(1, module["classes_wrapped"])
+        self.assertGreater(module["exec_ns"], 0)
+        self.assertGreater(module["scan_ns"], 0)
+        service = profile["classes"][f"{PROFILED_MODULE}.Service"]
+        # the constructor and the lazy getter
+        self.assertEqual(2, service["functions"])
+        self.assertGreater(service["compile_ns"], 0)
+        self.assertGreater(service["annotations_ns"], 0)
+        self.assertEqual(1, profile["totals"]["classes_wrapped"])
+
+    def test_di_init_report(self):
+        report = run_profiled(
+            f"import {PROFILED_MODULE}; from easy_di import di_init; di_init(profile=True)"
+        )
+
+        self.assertIn("easy_di startup profile", report)
+        self.assertIn(PROFILED_MODULE, report)
+        self.assertIn(f"{PROFILED_MODULE}.Service", report)
+
+    def test_not_enabled_by_default(self):
+        report = run_profiled(f"import easy_di; import {PROFILED_MODULE}")
+
+        self.assertNotIn("easy_di startup profile", report)
+
+    def test_environment_variable_flags(self):
+        for flag in ("0", "false", "No"):
+            with self.subTest(flag=flag), tempfile.TemporaryDirectory() as directory:
+                report = run_profiled(
+                    f"import easy_di; import {PROFILED_MODULE}",
+                    cwd=directory,
+                    EASY_DI_PROFILE=flag,
+                )
+
+                self.assertNotIn("easy_di startup profile", report)
+                self.assertEqual([], os.listdir(directory))
+        report = run_profiled(
+            f"import easy_di; import {PROFILED_MODULE}", EASY_DI_PROFILE="true"
+        )
+        self.assertIn("easy_di startup profile", report)
+
+    def test_report_sorted_by_time(self):
+        profile = StartupProfile()
+        profile.module_scanned("fast", 1_000, 1, 0)
+        profile.module_scanned("slow", 5_000_000, 4, 2)
+
+        lines = profile.report().splitlines()
+
+        self.assertLess(
+            next(i for i, line in enumerate(lines) if line.endswith("slow")),
+            next(i for i, line in enumerate(lines) if line.endswith("fast")),
+        )
+        self.assertIn("classes wrapped            2", profile.report())
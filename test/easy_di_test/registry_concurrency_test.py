@@ -0,0 +1,92 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from easy_di_test.benchmarks import stress_bench
+
+from easy_di import DI, di_init, di_storage, injected
+from easy_di.injection import ConstructorWrapper, DiClassInjector
+
+
+class RegistryConcurrencyTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def test_binding_published_with_its_kind(self):
+        DI.register("concurrency_value", "value", force=True)
+        factory = lambda: "built"  # noqa: E731
+        DI.register("concurrency_value", factory, force=True, is_factory=True)
+
+        entry = di_storage.entry("concurrency_value")
+        self.assertEqual((factory, True), entry.binding)
+        # the kind-specific slots keep the last value of their kind
+        self.assertEqual("value", entry.instance)
+        self.assertIs(factory, entry.factory)
+
+    def test_no_torn_reads_while_registering(self):
+        result = stress_bench.stress(readers=4, seconds=0.3)
+
+        self.assertGreater(result.built, 0)
+        self.assertGreater(result.registrations, 0)
+        self.assertEqual(0, result.errors)
+
+    def test_concurrent_duplicate_registrations(self):
+        barrier = threading.Barrier(8)
+        failures = []
+
+        def register():
+            barrier.wait()
+            try:
+                DI.register("concurrency_once", object())
+            except Exception as e:  # pylint: disable=broad-except
+                failures.append(e)
+
+        threads = [threading.Thread(target=register) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(7, len(failures))
+
+    def test_registration_during_injection(self):
+        DI.register("concurrency_db", "old instance", force=True)
+        compile_wrapper = ConstructorWrapper._compile_wrapper.__func__
+        compiling, release = threading.Event(), threading.Event()
+        injecting = []
+
+        def slow_compile_wrapper(cls, *args, **kwargs):
+            if threading.current_thread() in injecting:
+                compiling.set()
+                release.wait(5)
+            return compile_wrapper(cls, *args, **kwargs)
+
+        class_ = type(
+            "InjectedWhileRegistering",
+            (),
+            {
+                "__annotations__": {"db": injected(str, "concurrency_db")},
+                "__module__": __name__,
+            },
+        )
+        injection = threading.Thread(target=DiClassInjector().inject, args=(class_,))
+        registration = threading.Thread(
+            target=DI.register,
+            args=("concurrency_db", lambda: "from factory"),
+            kwargs={"force": True, "is_factory": True},
+        )
+        injecting.append(injection)
+        with patch.object(
+            ConstructorWrapper, "_compile_wrapper", classmethod(slow_compile_wrapper)
+        ):
+            injection.start()
+            compiling.wait(5)
+            registration.start()
+            # the registration must wait for the constructor to be installed
+            registration.join(0.05)
+            release.set()
+            injection.join()
+            registration.join()
+
+        self.assertEqual("from factory", class_().db)
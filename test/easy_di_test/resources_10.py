@@ -0,0 +1,36 @@
+from easy_di import injected
+
+from .resources import Object1, Object2, Object3
+
+
+class FlatBase:
+    __di_flatten__ = True
+
+    a: injected(Object2, "flat_factory")
+
+
+class FlatChild(FlatBase):
+    b: injected(Object1, "flat_object")
+    calls = 0
+
+    def __init__(self, k):
+        super().__init__()
+        FlatChild.calls += 1
+        self.k = k
+
+
+class FlatGrandChild(FlatChild):
+    c: injected(Object3, "flat_object")
+
+
+class FlatGrandGrandChild(FlatGrandChild):
+    d: injected(Object2, "flat_factory")
+    b: injected(Object3, "flat_other")
+
+
+class Mixin:
+    e: injected(Object1, "flat_object")
+
+
+class NotFlattened(FlatGrandChild, Mixin):
+    f: injected(Object1, "flat_object")
@@ -0,0 +1,22 @@
+from easy_di import injected
+
+from .resources import Object1, Object2
+
+
+class Facade:
+    __di_bulk__ = True
+
+    first: injected(Object1, "bulk_first")
+    second: injected(Object1, "bulk_second")
+    third: injected(Object1, "bulk_first", force_no_factory=True)
+    factory: injected(Object2, "bulk_factory")
+
+    def __init__(self, key):
+        self.key = key
+
+
+class FacadeMissing:
+    __di_bulk__ = True
+
+    first: injected(Object1, "bulk_first")
+    missing: injected(Object1, "bulk_never_registered")
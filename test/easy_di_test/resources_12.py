@@ -0,0 +1,28 @@
+from easy_di import injected
+
+from .resources import Object1, Object2
+
+
+class Slotted:
+    __slots__ = ("value", "factory", "lazy", "key")
+
+    value: injected(Object1, "slots_value")
+    factory: injected(Object2, "slots_factory")
+    lazy: injected(Object1, "slots_value", lazy=True)
+
+    def __init__(self, key):
+        self.key = key
+
+
+class SlottedChild(Slotted):
+    __slots__ = ("other",)
+
+    other: injected(Object1, "slots_value")
+
+
+class SlottedBulk:
+    __di_bulk__ = True
+    __slots__ = ("value", "__dict__")
+
+    value: injected(Object1, "slots_value")
+    in_dict: injected(Object1, "slots_value")
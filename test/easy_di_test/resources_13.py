@@ -0,0 +1,19 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class WithShared:
+    logger: injected(Object1, "shared_logger", shared=True)
+    value: injected(Object1, "shared_value")
+
+
+class OnlyShared:
+    __slots__ = ()
+
+    logger: injected(Object1, "shared_logger", shared=True)
+    missing: injected(Object1, "shared_never_registered", shared=True)
+
+
+class WithSharedFactory:
+    built: injected(Object1, "shared_factory", shared=True)
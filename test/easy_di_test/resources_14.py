@@ -0,0 +1,7 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class OutOfScope:
+    value: injected(Object1, "scope_value")
@@ -0,0 +1,11 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class Listed:
+    value: injected(Object1, "scope_value")
+
+
+class NotListed:
+    value: injected(Object1, "scope_value")
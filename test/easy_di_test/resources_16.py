@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+import easy_di
+from easy_di import injected as dependency
+
+from . import resources
+from .resources import Object1
+
+if TYPE_CHECKING:
+    from .resources import Object2
+
+POSTPONED_NAME = "postponed_value"
+
+
+class Postponed:
+    dotted: easy_di.injected(resources.Object1, "postponed_value")
+    generic: dependency(List[Object1], "postponed_list")
+    optional: Optional[dependency(Object1, POSTPONED_NAME)]
+    lazy: dependency(Object1, name="postponed_value", lazy=True)
+    shared: dependency(Object1, "postponed_value", shared=True)
+    only_checked: dependency(Object2, "postponed_value")
+    not_injected: List[Object1]
@@ -0,0 +1,21 @@
+from easy_di import Injectable, injected
+
+from .resources import Object1
+
+
+class Service(Injectable):
+    value: injected(Object1, "injectable_value")
+
+
+class ChildService(Service):
+    other: injected(Object1, "injectable_value", lazy=True)
+
+    def __init__(self, k):
+        super().__init__()
+        self.k = k
+
+
+class SlottedService(Injectable):
+    __slots__ = ("value",)
+
+    value: injected(Object1, "injectable_value")
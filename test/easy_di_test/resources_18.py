@@ -0,0 +1,11 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class AsyncConsumer:
+    session: injected(Object1, "async_session", awaitable=True)
+
+
+class EagerConsumer:
+    session: injected(Object1, "async_session")
@@ -0,0 +1,17 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class RequestHandler:
+    session: injected(Object1, "scoped_session")
+    tenant: injected(Object1, "scoped_tenant", lazy=True)
+    config: injected(Object1, "scoped_config", shared=True)
+
+
+class Unscoped:
+    value: injected(Object1, "unscoped_value")
+
+
+class ConcurrentlyScoped:
+    db: injected(Object1, "scoped_race_db")
@@ -0,0 +1,41 @@
+import threading
+
+from easy_di import injected
+
+
+class Config:
+    pass
+
+
+class Database:
+    # set by the tests, shared with Cache: both must be built at the same time
+    barrier = None
+    config: injected(Config, "warm_config")
+
+    def __init__(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        self.thread = threading.current_thread()
+
+
+class Cache(Database):
+    pass
+
+
+class Service:
+    database: injected(Database, "warm_database")
+    cache: injected(Cache, "warm_cache")
+    # resolved on first access: not a dependency
+    service: injected(object, "warm_service", lazy=True)
+
+
+class CycleA:
+    b: injected(object, "warm_cycle_b")
+
+
+class CycleB:
+    c: injected(object, "warm_cycle_c")
+
+
+class CycleC:
+    a: injected(object, "warm_cycle_a")
@@ -0,0 +1,19 @@
+import os
+
+from easy_di import DI, injected
+
+
+class Connection:
+    def __init__(self):
+        self.pid = os.getpid()
+
+
+class Worker:
+    connection: injected(Connection, "process_connection")
+
+
+def connection_pid(_=None):
+    return DI.get("process_connection").pid, Worker().connection.pid, os.getpid()
+
+
+PROCESS_SETTING = "from the spec"
@@ -0,0 +1,23 @@
+import time
+
+from easy_di import injected
+
+
+class Clock:
+    pass
+
+
+class SlowRepository:
+    def __init__(self):
+        time.sleep(0.002)
+
+
+class Handler:
+    clock: injected(Clock, "stats_clock")
+    repository: injected(SlowRepository, "stats_repository")
+    raw_factory: injected(object, "stats_repository", force_no_factory=True)
+
+
+class BulkHandler:
+    __di_bulk__ = True
+    clock: injected(Clock, "stats_clock")
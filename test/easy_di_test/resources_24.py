@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from easy_di import injected
+
+
+class Plain:
+    pass
+
+
+class Repository:
+    pass
+
+
+class Service:
+    repository: injected(Repository, "profiled_repository")
+    lazy_repository: injected(Repository, "profiled_repository", lazy=True)
@@ -0,0 +1,28 @@
+from easy_di import injected
+
+from .resources import Object1, Object2
+
+
+class LazyFields:
+    eager: injected(Object1, "lazy_object")
+    lazy: injected(Object1, "lazy_object", lazy=True)
+    lazy_factory: injected(Object2, "lazy_factory", lazy=True)
+
+    def __init__(self, key):
+        self.key = key
+
+
+class LazyByDefault:
+    __di_lazy__ = True
+
+    first: injected(Object1, "lazy_object")
+    second: injected(Object2, "lazy_factory")
+    forced_eager: injected(Object1, "lazy_object", lazy=False)
+
+
+class LazyChild(LazyFields):
+    other: injected(Object1, "lazy_object", lazy=True)
+
+
+class LazyUndefined:
+    missing: injected(Object1, "lazy_never_registered", lazy=True)
@@ -0,0 +1,9 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class WithLifetimes:
+    singleton: injected(Object1, "singleton_resource")
+    per_thread: injected(Object1, "thread_resource")
+    transient: injected(Object1, "transient_resource")
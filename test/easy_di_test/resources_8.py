@@ -0,0 +1,23 @@
+from easy_di import injected
+
+from .resources import Object1, Object2
+
+
+class ToBeFrozen:
+    value: injected(Object1, "frozen_value")
+    factory: injected(Object2, "frozen_factory")
+
+    def __init__(self, key):
+        self.key = key
+
+
+class FrozenChild(ToBeFrozen):
+    other: injected(Object1, "frozen_value")
+
+
+class FrozenMissing:
+    missing: injected(Object1, "frozen_never_registered")
+
+
+class FrozenOddName:
+    missing: injected(Object1, "frozen_{1 + 1}_'never'_registered")
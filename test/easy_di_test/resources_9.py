@@ -0,0 +1,16 @@
+from easy_di import injected
+
+from .resources import Object1
+
+
+class DbConsumer:
+    db: injected(Object1, "index_db")
+    other: injected(Object1, "index_other")
+
+
+class LazyDbConsumer:
+    connection: injected(Object1, "index_db", lazy=True)
+
+
+class NotConsumer:
+    other: injected(Object1, "index_other")
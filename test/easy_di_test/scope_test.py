@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from easy_di import DI, di_init
+from easy_di.injection import DiModuleInjector, ModuleScope
+from easy_di.manifest import Manifest
+
+from .resources import Object1
+
+
+class ModuleScopeTest(TestCase):
+    def test_everything_by_default(self):
+        testing = ModuleScope()
+
+        self.assertIn("json", testing)
+        self.assertIn("my_app.models", testing)
+
+    def test_packages(self):
+        testing = ModuleScope(["my_app", "other.sub"])
+
+        self.assertIn("my_app", testing)
+        self.assertIn("my_app.models", testing)
+        self.assertIn("other.sub.models", testing)
+        self.assertNotIn("other", testing)
+        self.assertNotIn("my_application", testing)
+        self.assertNotIn("json", testing)
+
+    def test_exclude(self):
+        testing = ModuleScope(["my_app"], exclude=["my_app.vendored"])
+
+        self.assertIn("my_app.models", testing)
+        self.assertNotIn("my_app.vendored", testing)
+        self.assertNotIn("my_app.vendored.lib", testing)
+        self.assertNotIn("json", ModuleScope(exclude=["json"]))
+
+
+class ScopedImportTest(TestCase):
+    def setUp(self) -> None:
+        di_init()
+        self.scope = DiModuleInjector.scope
+        DI.register("scope_value", Object1(), force=True)
+
+    def tearDown(self) -> None:
+        DiModuleInjector.scope = self.scope
+
+    def test_excluded_module_not_injected(self):
+        di_init(exclude=["easy_di_test.resources_14"])
+
+        from .resources_14 import OutOfScope
+
+        self.assertFalse(hasattr(OutOfScope(), "value"))
+
+    def test_manifest(self):
+        di_init(manifest=Manifest({"easy_di_test.resources_15": {"Listed": ["value"]}}))
+
+        from .resources_15 import Listed, NotListed
+
+        self.assertTrue(hasattr(Listed(), "value"))
+        self.assertFalse(hasattr(NotListed(), "value"))
@@ -0,0 +1,87 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, Lifetime, di_init
+from easy_di.exceptions import UndefinedResourceException
+from easy_di.injection import SharedInjection
+
+from .resources import Object1
+
+
+class SharedInjectionTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.logger = Object1()
+        self.value = Object1()
+        DI.register("shared_logger", self.logger, force=True)
+        DI.register("shared_value", self.value, force=True)
+
+    def test_not_stored_in_instance(self):
+        from .resources_13 import WithShared
+
+        testing = WithShared()
+
+        self.assertEqual({"value": self.value}, testing.__dict__)
+        self.assertIs(self.logger, testing.logger)
+        self.assertIsInstance(WithShared.logger, SharedInjection)
+        self.assertNotIn("logger", WithShared.__init__.__di_code__)
+
+    def test_follows_registrations(self):
+        from .resources_13 import WithShared
+
+        testing = WithShared()
+        other = Object1()
+        DI.register("shared_logger", other, force=True)
+
+        self.assertIs(other, testing.logger)
+
+    def test_no_constructor_needed(self):
+        from .resources_13 import OnlyShared
+
+        testing = OnlyShared()
+
+        self.assertIs(object.__init__, OnlyShared.__init__)
+        self.assertIs(self.logger, testing.logger)
+        with self.assertRaises(UndefinedResourceException):
+            _ = testing.missing
+
+    def test_factory_called_once(self):
+        from .resources_13 import WithSharedFactory
+
+        factory = Mock(side_effect=Object1)
+        DI.register("shared_factory", factory, force=True, is_factory=True)
+        testing = WithSharedFactory()
+
+        built = testing.built
+
+        self.assertIs(built, testing.built)
+        self.assertIs(built, WithSharedFactory().built)
+        factory.assert_called_once_with()
+
+        DI.register("shared_factory", Object1, force=True, is_factory=True)
+        self.assertIsNot(built, testing.built)
+
+    def test_thread_factory_per_thread(self):
+        from .resources_13 import WithSharedFactory
+
+        DI.register("shared_factory", Object1, force=True, lifetime=Lifetime.THREAD)
+        testing = WithSharedFactory()
+        other_thread = []
+        thread = threading.Thread(target=lambda: other_thread.append(testing.built))
+        thread.start()
+        thread.join()
+
+        self.assertIs(testing.built, testing.built)
+        self.assertIsNot(testing.built, other_thread[0])
+
+    def test_consumers(self):
+        from .resources_13 import OnlyShared, WithShared
+
+        self.assertEqual(
+            {WithShared: ["logger"], OnlyShared: ["logger"]},
+            DI.consumers("shared_logger"),
+        )
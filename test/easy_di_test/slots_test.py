@@ -0,0 +1,74 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from easy_di import DI, di_init
+from easy_di.exceptions import MissingSlotException
+from easy_di.injection import DiClassInjector, LazySlotInjection
+
+from .resources import Object1
+
+
+class SlotsTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        self.value = Object1()
+        self.factory = Mock()
+        DI.register("slots_value", self.value, force=True)
+        DI.register("slots_factory", self.factory, force=True, is_factory=True)
+
+    def test_slotted_class(self):
+        from .resources_12 import Slotted
+
+        testing = Slotted(1)
+
+        self.assertFalse(hasattr(testing, "__dict__"))
+        self.assertEqual(1, testing.key)
+        self.assertIs(self.value, testing.value)
+        self.assertIs(self.factory.return_value, testing.factory)
+
+    def test_lazy_slot(self):
+        from .resources_12 import Slotted
+
+        testing = Slotted(1)
+
+        self.assertIsInstance(Slotted.__dict__["lazy"], LazySlotInjection)
+        self.assertIs(self.value, testing.lazy)
+        other = Object1()
+        testing.lazy = other
+        self.assertIs(other, testing.lazy)
+        del testing.lazy
+        self.assertIs(self.value, testing.lazy)
+
+    def test_slotted_child(self):
+        from .resources_12 import SlottedChild
+
+        testing = SlottedChild(2)
+
+        self.assertFalse(hasattr(testing, "__dict__"))
+        self.assertIs(self.value, testing.other)
+        self.assertIs(self.value, testing.value)
+        self.assertIs(self.value, testing.lazy)
+
+    def test_bulk_skips_slots(self):
+        from .resources_12 import SlottedBulk
+
+        testing = SlottedBulk()
+
+        self.assertEqual(["in_dict"], list(SlottedBulk.__init__.__di_bundle__))
+        self.assertEqual({"in_dict": self.value}, testing.__dict__)
+        self.assertIs(self.value, testing.value)
+
+    def test_missing_slot(self):
+        class MissingSlot:
+            __slots__ = ("value",)
+
+            value: "injected(Object1, 'slots_value')"
+            other: "injected(Object1, 'slots_value')"
+
+        MissingSlot.__module__ = __name__
+
+        with self.assertRaises(MissingSlotException):
+            DiClassInjector().inject(MissingSlot)
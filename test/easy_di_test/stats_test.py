@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from easy_di import DI, di_init
+from easy_di.injection import ConstructorWrapper, InjectionWrapper
+
+from .resources_23 import BulkHandler, Clock, Handler, SlowRepository
+
+
+class StatsTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        DI.register("stats_clock", Clock(), force=True)
+        DI.register("stats_repository", SlowRepository, force=True, is_factory=True)
+        DI.enable_stats()
+
+    def tearDown(self) -> None:
+        DI.disable_stats()
+
+    def test_counts_resolutions_and_times_factories(self):
+        for _ in range(3):
+            Handler()
+
+        stats = DI.stats()
+        clock = stats.resources["stats_clock"]
+        repository = stats.resources["stats_repository"]
+        self.assertEqual(3, clock.resolutions)
+        self.assertEqual(0, clock.factory_calls)
+        # the factory called by `repository`, plus the factory injected as is in `raw_factory`
+        self.assertEqual(6, repository.resolutions)
+        self.assertEqual(3, repository.factory_calls)
+        self.assertGreaterEqual(repository.mean_factory_ns, 2_000_000)
+        self.assertEqual(3, sum(repository.histogram().values()))
+        self.assertGreaterEqual(repository.percentile(0.5), 2_000_000)
+        self.assertEqual(3, stats.classes[Handler].instances)
+        self.assertGreaterEqual(stats.classes[Handler].injection_ns, 6_000_000)
+
+    def test_bulk_fields_counted(self):
+        BulkHandler()
+
+        self.assertEqual(1, DI.stats().resources["stats_clock"].resolutions)
+        self.assertEqual(1, DI.stats().classes[BulkHandler].instances)
+
+    def test_snapshot_and_reset(self):
+        Handler()
+        snapshot = DI.stats()
+        Handler()
+
+        self.assertEqual(1, snapshot.classes[Handler].instances)
+        DI.enable_stats()
+        self.assertEqual(0, DI.stats().classes[Handler].instances)
+
+    def test_follows_kind_changes(self):
+        DI.register("stats_clock", Clock, force=True, is_factory=True)
+        Handler()
+
+        self.assertEqual(1, DI.stats().resources["stats_clock"].factory_calls)
+
+    def test_disabled_compiles_back(self):
+        instrumented = Handler.__init__.__di_code__
+        DI.disable_stats()
+
+        self.assertIn("_perf_counter_ns", instrumented)
+        self.assertNotIn("_stats_", Handler.__init__.__di_code__)
+        self.assertNotIn("_perf_counter_ns", Handler.__init__.__di_code__)
+        Handler()
+        self.assertEqual(0, DI.stats().classes[Handler].instances)
+
+    def test_instrumented_code(self):
+        # pylint: disable=protected-access
+        code = ConstructorWrapper._assemble_code(
+            {"a": InjectionWrapper(str, None), "b": InjectionWrapper(str, "the_b")},
+            object.__init__,
+            {"a": False},
+            instrumented=True,
+        )
+        self.assertEqual(
+            """def injected_constructor(self, *params, **kwargs):
+    _start = _perf_counter_ns()
+    try:
+        self.a = _entry_a.instance
+        _stats_a.resolutions += 1
+        _value, _is_factory = _entry_b.binding
+        if _is_factory:
+            _factory_start = _perf_counter_ns()
+            self.b = _value()
+            _stats_b.factory_called(_perf_counter_ns() - _factory_start)
+        else:
+            self.b = _value
+            _stats_b.resolutions += 1
+    except AttributeError as e:
+        raise UndefinedResourceException(
+              f'`{e.args[0]}` Needed by class {self.__class__.__name__}') from e
+    _class_stats.constructed(_perf_counter_ns() - _start)
+""",
+            code,
+        )
@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from easy_di import DI, di_storage
+from easy_di.exceptions import UndefinedResourceException
+
+
+class StorageTest(TestCase):
+    def test_entry_updated_in_place(self):
+        entry = di_storage.entry("storage_resource")
+
+        DI.register("storage_resource", 1, force=True)
+        DI.register("storage_resource", 2, force=True)
+
+        self.assertIs(entry, di_storage.entry("storage_resource"))
+        self.assertEqual(2, entry.value)
+        self.assertFalse(entry.is_factory)
+        self.assertGreaterEqual(entry.version, 2)
+
+    def test_lookup_not_registered(self):
+        di_storage.entry("storage_needed_only")
+
+        self.assertIsNone(di_storage.lookup("storage_needed_only"))
+        self.assertIsNone(di_storage.is_factory("storage_needed_only"))
+        self.assertFalse(DI.exists("storage_needed_only"))
+        with self.assertRaises(AttributeError) as context:
+            _ = di_storage.entry("storage_needed_only").value
+        self.assertEqual(("storage_needed_only",), context.exception.args)
+
+    def test_get(self):
+        DI.register("storage_factory", lambda: 3, force=True, is_factory=True)
+
+        self.assertEqual(3, DI.get("storage_factory"))
+        self.assertEqual(4, DI.get("storage_missing", 4))
+        with self.assertRaises(UndefinedResourceException):
+            DI.get("storage_missing")
+
+    def test_handle(self):
+        handle = DI.handle("storage_handle")
+
+        with self.assertRaises(UndefinedResourceException):
+            handle()
+        DI.register("storage_handle", 1, force=True)
+        self.assertEqual(1, handle())
+        DI.register("storage_handle", lambda: 2, force=True, is_factory=True)
+        self.assertEqual(2, handle())
+        self.assertIs(handle, DI.handle("storage_handle"))
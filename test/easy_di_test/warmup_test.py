@@ -0,0 +1,94 @@
+import threading
+from unittest import TestCase
+
+from easy_di import DI, di_init, di_storage
+from easy_di.exceptions import DependencyCycleException, UndefinedResourceException
+from easy_di.lifetimes import SingletonFactory
+from easy_di.warmup import DependencyGraph
+
+from . import resources_20
+from .resources_20 import Cache, Config, CycleA, CycleB, CycleC, Database, Service
+
+
+class WarmupTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        di_init()
+
+    def setUp(self) -> None:
+        DI.register("warm_config", Config, force=True, lifetime="singleton")
+        DI.register("warm_database", Database, force=True, lifetime="singleton")
+        DI.register("warm_cache", Cache, force=True, lifetime="singleton")
+        DI.register("warm_service", Service, force=True, lifetime="singleton")
+
+    def tearDown(self) -> None:
+        resources_20.Database.barrier = None
+
+    def test_dependency_graph(self):
+        graph = DependencyGraph.from_storage()
+
+        self.assertEqual(set(), graph.dependencies["warm_config"])
+        self.assertEqual({"warm_config"}, graph.dependencies["warm_database"])
+        self.assertEqual(
+            {"warm_database", "warm_cache"}, graph.dependencies["warm_service"]
+        )
+
+    def test_undefined_resource(self):
+        with self.assertRaises(UndefinedResourceException) as raised:
+            DI.warmup("warm_service", "warm_databse")
+
+        self.assertEqual(("warm_databse",), raised.exception.args)
+        self.assertFalse(isinstance(di_storage.entry("warm_service").value, Service))
+
+    def test_topological_order(self):
+        built = DI.warmup("warm_service", workers=1)
+
+        self.assertEqual("warm_config", built[0])
+        self.assertEqual({"warm_database", "warm_cache"}, set(built[1:3]))
+        self.assertEqual("warm_service", built[3])
+        service = DI.get("warm_service")
+        self.assertIsInstance(service, Service)
+        self.assertIs(DI.get("warm_database"), service.database)
+        self.assertIs(service, service.service)
+
+    def test_independent_branches_in_parallel(self):
+        resources_20.Database.barrier = threading.Barrier(2, timeout=5)
+
+        DI.warmup("warm_service", workers=2)
+
+        self.assertIsNot(DI.get("warm_database").thread, DI.get("warm_cache").thread)
+
+    def test_already_built_skipped(self):
+        DI.warmup("warm_database")
+
+        self.assertEqual(
+            ["warm_cache", "warm_service"], sorted(DI.warmup("warm_service"))
+        )
+
+    def test_cycle(self):
+        DI.register("warm_cycle_a", CycleA, force=True, lifetime="singleton")
+        DI.register("warm_cycle_b", CycleB, force=True, lifetime="singleton")
+        DI.register("warm_cycle_c", CycleC, force=True, lifetime="singleton")
+        try:
+            with self.assertRaises(DependencyCycleException) as raised:
+                DI.warmup("warm_cycle_b", "warm_service")
+            self.assertEqual(
+                "warm_cycle_a -> warm_cycle_b -> warm_cycle_c -> warm_cycle_a",
+                str(raised.exception),
+            )
+            # nothing built
+            self.assertIsInstance(
+                di_storage.entry("warm_config").value, SingletonFactory
+            )
+        finally:
+            for name in ("warm_cycle_a", "warm_cycle_b", "warm_cycle_c"):
+                DI.register(name, object(), force=True)
+
+    def test_failure(self):
+        def fail():
+            raise ValueError("no connection")
+
+        DI.register("warm_database", fail, force=True, lifetime="singleton")
+
+        with self.assertRaises(ValueError):
+            DI.warmup("warm_service")